@@ -5,8 +5,13 @@ import cv2
 import numpy as np
 import time
 import threading
+import queue
+import concurrent.futures
 import random
 import os
+import re
+import functools
+from collections import Counter, OrderedDict, deque
 from PIL import Image, ImageGrab
 import win32gui
 import win32con
@@ -14,14 +19,134 @@ import win32api
 from typing import Tuple, Optional, List, Dict, Any
 from datetime import datetime
 import pytesseract
+from input_manager import set_high_resolution_timer
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def count_pokemon_pixels(hsv):
+        """Count pixels in the red/yellow/blue/purple sprite hue ranges in one pass"""
+        height, width, _ = hsv.shape
+        count = 0
+        for y in prange(height):
+            for x in range(width):
+                h = hsv[y, x, 0]
+                if hsv[y, x, 1] < 50 or hsv[y, x, 2] < 50:
+                    continue
+                if h <= 10 or h >= 170 or 20 <= h <= 30 or 100 <= h <= 170:
+                    count += 1
+        return count
+    
+    @njit(cache=True)
+    def char_overlap_similarity(a, b):
+        """Shared-character similarity of two byte arrays: 2 * multiset overlap / (len(a) + len(b))"""
+        counts_a = np.zeros(256, np.int32)
+        counts_b = np.zeros(256, np.int32)
+        for ch in a:
+            counts_a[ch] += 1
+        for ch in b:
+            counts_b[ch] += 1
+        matches = 0
+        for i in range(256):
+            matches += min(counts_a[i], counts_b[i])
+        return 2.0 * matches / (len(a) + len(b))
+    
+    @njit(cache=True, boundscheck=False)
+    def subsequence_matches(p, w):
+        """Number of p's bytes found in order (gaps allowed) in w"""
+        matches = 0
+        j = 0
+        n = len(w)
+        for i in range(len(p)):
+            while j < n:
+                j += 1
+                if w[j - 1] == p[i]:
+                    matches += 1
+                    break
+        return matches
+
+def _timed(name: str):
+    """Record per-call latency of an engine stage when debug_metrics is enabled"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not self.debug_metrics:
+                return func(self, *args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._record_metric(name, time.perf_counter_ns() - start)
+        return wrapper
+    return decorator
+
+@functools.lru_cache(maxsize=1)
+def _resolve_tesseract() -> Optional[str]:
+    """Path of the first Tesseract install found in the common Windows locations (probed once)"""
+    possible_paths = [
+        r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+        r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+        r'C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME', '')),
+        r'C:\tesseract\tesseract.exe'
+    ]
+    
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    return None
 
 class AutoHuntEngine:
     """Main engine for automated Pokemon hunting with screen recognition"""
     
+    # Tesseract settings shared by every OCR pass (letters and spaces only)
+    _TESS_WHITELIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+    _TESS_CFG6 = '--oem 3 --psm 6 -c tessedit_char_whitelist=' + _TESS_WHITELIST  # Uniform block of text
+    _TESS_CFG7 = '--oem 3 --psm 7 -c tessedit_char_whitelist=' + _TESS_WHITELIST  # Single text line
+    _TESS_CFG8 = '--oem 3 --psm 8 -c tessedit_char_whitelist=' + _TESS_WHITELIST  # Single word
+    
+    # Closing lines of every special-encounter popup
+    _POPUP_SUFFIX = "⚠️ Hunt has been PAUSED.\n📁 Screenshot saved in debug_screenshots.\n🎮 Check your game!"
+    
     def __init__(self, window_manager, input_manager):
         self.window_manager = window_manager
         self.input_manager = input_manager
         
+        # Stage latency metrics (see _timed), printed every metrics_interval seconds
+        self.debug_metrics = False
+        self.metrics_interval = 5.0
+        self.verbose = False  # Per-call template matching logs (these run on every poll of the hunt loops)
+        self._metrics = {}  # name -> [count, total_ns, max_ns, recent samples]
+        self._metrics_last_report = time.monotonic()
+        
         # State management
         self.is_hunting = False
         self.is_paused = False
@@ -36,9 +161,26 @@ class AutoHuntEngine:
         # Movement settings
         self.movement_duration = 0.5  # How long to hold movement keys
         self.movement_pause = 0.3     # Pause between movements
+        self._held_key = None         # Movement key currently held down
+        self._release_at = 0.0        # time.monotonic() deadline for releasing it
+        self.hold_probe_interval = 0.1  # Battle-menu probe spacing while a movement key is held
         
         # Templates for screen recognition (will be loaded from files)
         self.templates = {}
+        self._template_pyramid = {}        # Template name -> (coarse-level template uint8, full template float32), gray
+        self._template_f32 = {}            # Template name -> single-channel float32 copy in [0, 1]
+        self._template_umat = {}           # Template name -> _template_pyramid pair uploaded as cv2.UMat (OpenCL only)
+        self._scratch = threading.local()  # Backs the four per-thread frame buffers below (see _screen_f32)
+        self._screen_f32 = None            # Reused per-frame float32 grayscale buffer
+        self._last_screen = None           # Screenshot whose conversion _screen_f32 currently holds
+        self._screen_u8 = None             # uint8 grayscale of that same screenshot (source of the coarse level)
+        self._coarse_result_bufs = {}      # Result shape -> reused float32 output of the CPU coarse match
+        self._battle_hash_refs = {}        # (template name, frame size) -> (menu location, 64-bit aHash of the menu)
+        self.battle_hash_max_distance = 12 # Hamming distance above which the menu area can't be the menu
+        self.battle_hash_recheck = 1.0     # Seconds of gated frames in a row before the full match runs anyway
+        self._battle_hash_last_full = 0.0  # time.monotonic() of the last full (ungated) battle menu match
+        self.pyramid_scale = 0.25          # Coarse template-matching level (1/4 per axis)
+        self.pyramid_coarse_margin = 0.1   # Coarse scores run lower, so candidates use threshold - margin
         self.current_direction = 'a'  # Start with 'a', will alternate with 'd'
         
         # Statistics
@@ -50,6 +192,7 @@ class AutoHuntEngine:
         self.status_callback = None
         self.encounter_callback = None
         self.special_encounter_callback = None  # New callback for special encounters
+        self.popup_queue = queue.Queue()  # (title, message) encounter popups, shown by the UI's Tk main loop
         
         # Screenshot saving
         self.screenshot_counter = 0
@@ -57,20 +200,73 @@ class AutoHuntEngine:
         self.debug_dir = "debug_screenshots"
         self.ensure_screenshot_directory()
         
+        # Debug images are encoded and written by a background thread
+        self._debug_write_queue = queue.Queue(maxsize=32)
+        self._debug_writer_thread = threading.Thread(target=self._debug_writer_loop, daemon=True)
+        self._debug_writer_thread.start()
+        
+        # Small pool for housekeeping that can overlap the encounter handler's idle waits
+        self._background_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="hunt-bg")
+        
         # Setup Tesseract path for OCR
         self._setup_tesseract()
         
+        # OpenCL (T-API) acceleration for the image-processing pipeline, on top of OpenCV's SIMD paths
+        cv2.setUseOptimized(True)
+        self.use_opencl = self._setup_opencl()
+        self.detection_downscale = 4  # Edge/morphology detectors work on 1/4 width x 1/4 height
+        
+        # Interframe-delta gate: skip detectors when the screen hasn't changed
+        self.frame_change_eps = 2.0 * 32 * 32  # L1 distance of 32x32 thumbnails (~2 levels/pixel)
+        self._last_thumb = None
+        self._last_battle_result = False
+        
+        # Battle-menu probe area as fractions of the game window (left, top, right, bottom)
+        self.battle_menu_roi = (0.0, 0.5, 1.0, 1.0)
+        self._last_roi_hash = None
+        self._capture_local = threading.local()  # Per-thread mss instance for ROI captures
+        self._region_buf = None  # Reused BGR array for capture_game_region(reuse_buffer=True)
+        
         # Pokemon name detection and special encounter system
         self.normal_pokemon_list = [
             'sentret', 'pidgey', 'pidgeotto', 'hoppip', 'meowth', 
             'persian', 'psyduck','furret', 'slowpoke'
         ]
+        self._rebuild_pokemon_lookups()
+        self._legendary_set = frozenset(('moltres', 'articuno', 'entei', 'zapdos', 'suicune', 'raikou'))
+        self._subseq_memo = (None, None, {})  # (text, code points, char -> sorted positions) for long-text matching
+        if NUMBA_AVAILABLE:
+            # Compile the subsequence matcher now so the first OCR frame doesn't pay for it
+            subsequence_matches(self._name_bytes('warmup'), self._name_bytes('warmup'))
         self.special_encounters_found = 0
         self.shiny_encounters_found = 0
         self.horde_encounters_found = 0
         self.last_detected_pokemon = ""
         self.last_encounter_type = "normal"  # normal, special, shiny, horde
         
+        # OCR settings
+        self._ocr_block_config = self._TESS_CFG6
+        self.ocr_mosaic_gap = 20  # Blank rows between tiles of a batched OCR mosaic
+        self._ocr_variant_wins = {}  # Preprocessing variant -> confident reads, used to order the ladder
+        self._ocr_cache = OrderedDict()  # (crop hash, shape) -> (names, is_horde, contains_shiny), LRU
+        self.ocr_cache_size = 128
+        self._ocr_buf = None  # Reused grayscale buffer for the custom-area test, sized to the area
+        self._ocr_cache_lock = threading.Lock()  # Cache is shared with the batched OCR worker
+        
+        # Batched name-area OCR: frames submitted while hunting are read together by one worker
+        self.ocr_batch_size = 8        # Max frames per Tesseract run
+        self.ocr_batch_timeout = 0.5   # Seconds to wait for more frames before reading a partial batch
+        self._ocr_queue = queue.Queue(maxsize=16)
+        self._ocr_worker_thread = None  # Started by the first submit_ocr_frame
+        self._ocr_worker_lock = threading.Lock()
+        
+        # OCR preprocessing tables
+        self._contrast_ramp = np.arange(256, dtype=np.float32)
+        self._sharpen_kernel = np.array([[-2, -2, -2], [-2, 32, -2], [-2, -2, -2]], dtype=np.float32) / 16.0
+        
+        # OCR text cleanup table (latin-1 bytes): letters map to lowercase, everything else to a space
+        self._ocr_lut = bytes(ord(chr(i).lower()) if chr(i).isalpha() else 32 for i in range(256))
+        
         # NEW: Sprite detection system
         self.sprite_dir = "sprites"
         self.pokemon_sprites = {}  # Will store loaded Pokemon sprites
@@ -91,17 +287,96 @@ class AutoHuntEngine:
     
     def _setup_tesseract(self):
         """Setup Tesseract OCR path for Windows"""
-        import os
-        possible_paths = [
-            r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-            r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-            r'C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME', '')),
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                pytesseract.pytesseract.tesseract_cmd = path
-                break
+        self._tesseract_cmd = _resolve_tesseract()  # Reused by the OCR test paths
+        self._tess_api = None                       # In-process tesserocr engine, created on first use
+        if self._tesseract_cmd:
+            pytesseract.pytesseract.tesseract_cmd = self._tesseract_cmd
+    
+    def _get_tess_api(self):
+        """Persistent tesserocr engine (model loaded once), or None when tesserocr is unavailable"""
+        if self._tess_api is None and TESSEROCR_AVAILABLE:
+            import os
+            try:
+                kwargs = {'psm': tesserocr.PSM.SINGLE_BLOCK, 'oem': tesserocr.OEM.DEFAULT}
+                if self._tesseract_cmd:
+                    kwargs['path'] = os.path.join(os.path.dirname(self._tesseract_cmd), 'tessdata')
+                api = tesserocr.PyTessBaseAPI(**kwargs)
+                api.SetVariable('tessedit_char_whitelist', self._TESS_WHITELIST)
+                self._tess_api = api
+                print("✓ tesserocr engine loaded")
+            except Exception as e:
+                print(f"⚠ tesserocr unavailable, using pytesseract: {e}")
+        return self._tess_api
+    
+    def _setup_opencl(self) -> bool:
+        """Enable OpenCV's OpenCL path (cv2.UMat) when a device is available"""
+        try:
+            if cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                if cv2.ocl.useOpenCL():
+                    print("✓ OpenCL enabled for image processing")
+                    return True
+        except Exception as e:
+            print(f"⚠️ OpenCL unavailable, using CPU path: {e}")
+        return False
+    
+    def _to_umat(self, image: np.ndarray):
+        """Upload an image to the OpenCL device, or return it unchanged on the CPU path"""
+        if self.use_opencl:
+            return cv2.UMat(np.ascontiguousarray(image))
+        return image
+    
+    def _downsample_region(self, region: np.ndarray):
+        """Shrink a region by detection_downscale before edge/morphology work, returns (image, width, height)"""
+        height, width = region.shape[:2]
+        factor = self.detection_downscale
+        small_width, small_height = max(1, width // factor), max(1, height // factor)
+        
+        image = self._to_umat(region)
+        if factor > 1:
+            image = cv2.resize(image, (small_width, small_height), interpolation=cv2.INTER_AREA)
+        return image, small_width, small_height
+    
+    def _count_horizontal_runs(self, mask, length: int) -> int:
+        """Count mask pixels on horizontal runs of at least `length` (box-filter form of a 1xN MORPH_OPEN)"""
+        # Row-wise running sums: a full window marks the core of a long enough run (erosion)
+        runs = cv2.boxFilter(mask, cv2.CV_32F, (length, 1), normalize=False)
+        _, cores = cv2.threshold(runs, length * 255 - 1, 1, cv2.THRESH_BINARY)
+        
+        # Spread the cores back over the whole run (dilation) - both passes are O(pixels)
+        lines = cv2.boxFilter(cores, -1, (length, 1), normalize=False)
+        return cv2.countNonZero(lines)
+    
+    def _frame_unchanged(self, screenshot: np.ndarray) -> bool:
+        """Compare a 32x32 grayscale thumbnail with the last frame the detector ran on, True when nearly identical
+        Accepts a BGR frame or its uint8 grayscale. The reference only moves when the frame counts as changed,
+        so a slow fade can't creep past the gate a little at a time"""
+        gray = screenshot if screenshot.ndim == 2 else cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+        thumb = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+        if self._last_thumb is not None and cv2.norm(thumb, self._last_thumb, cv2.NORM_L1) < self.frame_change_eps:
+            return True
+        self._last_thumb = thumb  # The caller runs the detector on this frame
+        return False
+    
+    def _debug_writer_loop(self):
+        """Write queued debug images to disk off the detection path"""
+        while True:
+            filepath, image = self._debug_write_queue.get()
+            try:
+                cv2.imwrite(filepath, image)
+            except Exception as e:
+                print(f"❌ Error writing debug image {filepath}: {e}")
+            finally:
+                self._debug_write_queue.task_done()
+    
+    def _queue_debug_write(self, filepath: str, image: np.ndarray) -> bool:
+        """Hand a BGR image to the debug writer thread, dropping it if the queue is full"""
+        try:
+            self._debug_write_queue.put_nowait((filepath, image.copy()))
+            return True
+        except queue.Full:
+            print(f"⚠ Debug write queue full, skipping {filepath}")
+            return False
     
     def save_debug_screenshot(self, screenshot: np.ndarray, prefix: str = "debug") -> str:
         """Save screenshot for debugging purposes"""
@@ -115,9 +390,9 @@ class AutoHuntEngine:
             filename = f"{prefix}_{timestamp}_{self.screenshot_counter:03d}.png"
             filepath = os.path.join(self.screenshot_dir, filename)
             
-            # Convert OpenCV image back to PIL for saving
-            screenshot_pil = Image.fromarray(cv2.cvtColor(screenshot, cv2.COLOR_BGR2RGB))
-            screenshot_pil.save(filepath)
+            # Encoding and disk I/O happen on the debug writer thread
+            if not self._queue_debug_write(filepath, screenshot):
+                return ""
             
             # Track this screenshot for potential cleanup
             self.current_encounter_screenshots.append(filepath)
@@ -135,6 +410,9 @@ class AutoHuntEngine:
         
         deleted_count = 0
         
+        # Let pending background writes land first so nothing reappears after cleanup
+        self._debug_write_queue.join()
+        
         # Delete all debug screenshots, not just current encounter ones
         patterns = [
             "debug_screenshots/battle_menu_test_*.png",
@@ -173,6 +451,10 @@ class AutoHuntEngine:
         
         # Clear existing templates
         self.templates = {}
+        self._template_pyramid = {}
+        self._template_f32 = {}
+        self._template_umat = {}
+        self._battle_hash_refs = {}
         
         # Check if template directory exists
         if not os.path.exists(template_dir):
@@ -200,6 +482,15 @@ class AutoHuntEngine:
                         continue
                     
                     self.templates[template_name] = template
+                    # Every matching level is encoded once here and shared by reference with the detect_* paths
+                    template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+                    template_f32 = template_gray.astype(np.float32) / 255.0
+                    self._template_f32[template_name] = template_f32
+                    self._template_pyramid[template_name] = (self._coarse_level(template_gray), template_f32)
+                    if self.use_opencl:
+                        # Upload once so matching only transfers the frame
+                        self._template_umat[template_name] = tuple(
+                            self._to_umat(level) for level in self._template_pyramid[template_name])
                     template_count += 1
                     print(f"✓ Loaded template: {template_name} ({template_w}x{template_h})")
                 else:
@@ -258,6 +549,61 @@ class AutoHuntEngine:
             print(f"Error capturing screen: {e}")
             return None
     
+    def _battle_menu_roi_rect(self) -> Optional[Tuple[int, int, int, int]]:
+        """Screen rectangle of the battle-menu probe area for the current game window"""
+        game_rect = self.window_manager.game_rect
+        if not game_rect:
+            return None
+        
+        left, top, right, bottom = game_rect
+        width, height = right - left, bottom - top
+        fx1, fy1, fx2, fy2 = self.battle_menu_roi
+        return (left + int(width * fx1), top + int(height * fy1),
+                left + int(width * fx2), top + int(height * fy2))
+    
+    def capture_game_region(self, rect: Optional[Tuple[int, int, int, int]],
+                            reuse_buffer: bool = False) -> Optional[np.ndarray]:
+        """Capture a small screen rectangle (left, top, right, bottom) as a BGR image
+        
+        With reuse_buffer the image is written into one preallocated array that the next reusing
+        capture overwrites - only for callers that are done with the frame before capturing again.
+        """
+        if not rect:
+            return None
+        
+        try:
+            left, top, right, bottom = rect
+            if MSS_AVAILABLE:
+                # mss handles are bound to the thread that created them
+                sct = getattr(self._capture_local, 'sct', None)
+                if sct is None:
+                    sct = self._capture_local.sct = mss.mss()
+                shot = sct.grab({'left': left, 'top': top, 'width': right - left, 'height': bottom - top})
+                if not reuse_buffer:
+                    return cv2.cvtColor(np.asarray(shot), cv2.COLOR_BGRA2BGR)
+                
+                # Allocate once per region size, then convert straight into it
+                shape = (shot.height, shot.width, 3)
+                if self._region_buf is None or self._region_buf.shape != shape:
+                    self._region_buf = np.empty(shape, dtype=np.uint8)
+                cv2.cvtColor(np.asarray(shot), cv2.COLOR_BGRA2BGR, dst=self._region_buf)
+                # Same array object, new pixels - drop the _to_gray identity memo
+                self._last_screen = None
+                return self._region_buf
+            
+            region = ImageGrab.grab(bbox=rect)
+            return cv2.cvtColor(np.asarray(region), cv2.COLOR_RGB2BGR)
+        except Exception as e:
+            print(f"❌ Error capturing game region: {e}")
+            return None
+    
+    def _hash_region(self, region: np.ndarray) -> int:
+        """Fast content hash of an image region"""
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_intdigest(np.ascontiguousarray(region))
+        return hash(region.tobytes())
+    
+    @_timed('capture_full_game_screen')
     def capture_full_game_screen(self) -> Optional[np.ndarray]:
         """Capture screenshot of the entire game window (for battle menu detection)"""
         if not self.window_manager.is_game_running():
@@ -276,8 +622,9 @@ class AutoHuntEngine:
             # game_rect is a tuple: (left, top, right, bottom)
             left, top, right, bottom = game_rect
             
-            print(f"🖼️ Capturing game window: ({left}, {top}) to ({right}, {bottom})")
-            print(f"   Window size: {right-left}x{bottom-top} pixels")
+            if self.verbose:
+                print(f"🖼️ Capturing game window: ({left}, {top}) to ({right}, {bottom})")
+                print(f"   Window size: {right-left}x{bottom-top} pixels")
             
             # Try direct window capture first (better for overlapped windows)
             screenshot = self.capture_window_content(game_hwnd)
@@ -289,8 +636,8 @@ class AutoHuntEngine:
             print("🔄 Falling back to screen region capture...")
             screenshot = ImageGrab.grab(bbox=(left, top, right, bottom))
             
-            # Convert PIL image to OpenCV format
-            screenshot_cv = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+            # Convert PIL image to OpenCV format (asarray avoids an extra copy before the conversion)
+            screenshot_cv = cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2BGR)
             
             print(f"✓ Screenshot captured: {screenshot_cv.shape[1]}x{screenshot_cv.shape[0]} pixels")
             return screenshot_cv
@@ -338,7 +685,8 @@ class AutoHuntEngine:
             width = x1 - x
             height = y1 - y
             
-            print(f"🖼️ Capturing window content: {width}x{height} at ({x}, {y})")
+            if self.verbose:
+                print(f"🖼️ Capturing window content: {width}x{height} at ({x}, {y})")
             
             # Get window device context
             hwndDC = win32gui.GetWindowDC(hwnd)
@@ -358,16 +706,13 @@ class AutoHuntEngine:
                 bmpinfo = saveBitMap.GetInfo()
                 bmpstr = saveBitMap.GetBitmapBits(True)
                 
-                import numpy as np
-                screenshot = np.frombuffer(bmpstr, dtype='uint8')
-                screenshot.shape = (height, width, 4)  # BGRA format
+                screenshot = np.frombuffer(bmpstr, dtype=np.uint8).reshape(height, width, 4)  # BGRA view, no copy
                 
-                # Convert BGRA to BGR
-                screenshot = screenshot[:, :, :3]  # Remove alpha channel
-                screenshot = screenshot[:, :, ::-1]  # BGR to RGB
-                screenshot = cv2.cvtColor(screenshot, cv2.COLOR_RGB2BGR)
+                # Drop the alpha channel in a single pass straight into the BGR frame
+                screenshot = cv2.cvtColor(screenshot, cv2.COLOR_BGRA2BGR)
                 
-                print(f"✓ Window content captured: {screenshot.shape[1]}x{screenshot.shape[0]} pixels")
+                if self.verbose:
+                    print(f"✓ Window content captured: {screenshot.shape[1]}x{screenshot.shape[0]} pixels")
                 
                 # Cleanup
                 win32gui.DeleteObject(saveBitMap.GetHandle())
@@ -380,21 +725,25 @@ class AutoHuntEngine:
                 print("❌ PrintWindow failed, falling back to screen capture")
                 # Fallback to screen capture of window area
                 screenshot = ImageGrab.grab(bbox=(x, y, x1, y1))
-                screenshot_cv = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
+                screenshot_cv = cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2BGR)
                 return screenshot_cv
                 
         except Exception as e:
             print(f"❌ Error capturing window content: {e}")
             return None
     
-    def detect_template(self, screenshot: np.ndarray, template_name: str) -> Tuple[bool, Tuple[int, int]]:
-        """Detect if a template is present in the screenshot"""
+    @_timed('detect_template')
+    def detect_template(self, screenshot: np.ndarray, template_name: str,
+                        gray: Optional[np.ndarray] = None,
+                        small: Optional[np.ndarray] = None) -> Tuple[bool, Tuple[int, int]]:
+        """Detect if a template is present in the screenshot (on its _to_gray conversion when gray is given)"""
         if template_name not in self.templates:
             print(f"❌ Template '{template_name}' not loaded")
             return False, (0, 0)
         
         template = self.templates[template_name]
-        print(f"🔍 Testing template '{template_name}' ({template.shape[1]}x{template.shape[0]})")
+        if self.verbose:
+            print(f"🔍 Testing template '{template_name}' ({template.shape[1]}x{template.shape[0]})")
         
         # Check if template is smaller than screenshot (required for template matching)
         screenshot_h, screenshot_w = screenshot.shape[:2]
@@ -405,27 +754,183 @@ class AutoHuntEngine:
             return False, (0, 0)
         
         # Save template for debugging
-        self.save_debug_screenshot(template, f"template_{template_name}")
+        if self.verbose:
+            self.save_debug_screenshot(template, f"template_{template_name}")
         
         try:
-            # Perform template matching
-            result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+            # Perform template matching (coarse-to-fine on one channel when the caller already converted the frame)
+            if gray is not None:
+                small_template, template_f32 = self._template_pyramid[template_name]
+                max_val, max_loc = self._match_template_pyramid(gray, template_f32, small_template, small,
+                                                                template_name)
+            else:
+                result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
+                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
             
-            print(f"   Template match confidence: {max_val:.3f} (threshold: {self.template_threshold})")
+            if self.verbose:
+                print(f"   Template match confidence: {max_val:.3f} (threshold: {self.template_threshold})")
             
             # Check if match confidence is above threshold
             if max_val >= self.template_threshold:
                 print(f"✅ Template '{template_name}' matched at ({max_loc[0]}, {max_loc[1]})")
                 return True, max_loc
             
-            print(f"❌ Template '{template_name}' match too low: {max_val:.3f} < {self.template_threshold}")
+            if self.verbose:
+                print(f"❌ Template '{template_name}' match too low: {max_val:.3f} < {self.template_threshold}")
             return False, (0, 0)
             
         except Exception as e:
             print(f"❌ Error matching template '{template_name}': {e}")
             return False, (0, 0)
     
+    def _match_template_pyramid(self, screenshot: np.ndarray, template: np.ndarray,
+                                small_template: Optional[np.ndarray] = None,
+                                small: Optional[np.ndarray] = None,
+                                template_name: Optional[str] = None) -> Tuple[float, Tuple[int, int]]:
+        """Coarse-to-fine TM_CCOEFF_NORMED match, returns (best confidence, top-left location)
+        
+        small_template / small are optional precomputed _coarse_level copies of template / screenshot.
+        With OpenCL on, template_name selects the uploaded copies in _template_umat and the matches run on the device.
+        """
+        umats = self._template_umat.get(template_name) if self.use_opencl else None
+        if umats is not None:
+            try:
+                return self._match_pyramid_levels(screenshot, template, small_template, small, umats)
+            except cv2.error as e:
+                # A device that initialised but fails at run time would otherwise fail every poll - stay on the CPU
+                print(f"⚠️ OpenCL template matching failed, falling back to CPU: {e}")
+                self.use_opencl = False
+                cv2.ocl.setUseOpenCL(False)
+        return self._match_pyramid_levels(screenshot, template, small_template, small, None)
+    
+    def _match_pyramid_levels(self, screenshot: np.ndarray, template: np.ndarray,
+                              small_template: Optional[np.ndarray], small: Optional[np.ndarray],
+                              umats) -> Tuple[float, Tuple[int, int]]:
+        """Body of _match_template_pyramid; umats is the (coarse, full) UMat pair or None for the CPU path"""
+        screenshot_h, screenshot_w = screenshot.shape[:2]
+        template_h, template_w = template.shape[:2]
+        if template_h > screenshot_h or template_w > screenshot_w:
+            return 0.0, (0, 0)
+        
+        scale = self.pyramid_scale
+        if small_template is None:
+            small_template = self._coarse_level(template)
+        if min(small_template.shape[:2]) < 8:
+            # Too small to be meaningful at the coarse level - match at full resolution
+            if umats is not None:
+                result = cv2.matchTemplate(self._to_umat(screenshot), umats[1], cv2.TM_CCOEFF_NORMED)
+            else:
+                result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return max_val, max_loc
+        
+        # Coarse pass on the downscaled frame: candidate locations only
+        if small is None:
+            small = self._coarse_level(screenshot)
+        if umats is not None:
+            coarse = cv2.matchTemplate(self._to_umat(small), umats[0], cv2.TM_CCOEFF_NORMED).get()
+        else:
+            # The coarse map is consumed before the next match, so one buffer per result shape is reused
+            shape = (small.shape[0] - small_template.shape[0] + 1, small.shape[1] - small_template.shape[1] + 1)
+            buffer = self._coarse_result_bufs.get(shape)
+            if buffer is None:
+                buffer = self._coarse_result_bufs[shape] = np.empty(shape, dtype=np.float32)
+            coarse = cv2.matchTemplate(small, small_template, cv2.TM_CCOEFF_NORMED, result=buffer)
+        candidates = (coarse >= self.template_threshold - self.pyramid_coarse_margin).astype(np.uint8)
+        if not candidates.any():
+            return float(coarse.max()), (0, 0)
+        
+        # Merge neighbouring candidates, then confirm each region at full resolution
+        candidates = cv2.morphologyEx(candidates, cv2.MORPH_CLOSE, np.ones((3, 3), np.uint8))
+        count, _, stats, _ = cv2.connectedComponentsWithStats(candidates, connectivity=8)
+        
+        best_val, best_loc = 0.0, (0, 0)
+        pad = int(round(1 / scale))
+        # Upload the frame once; each candidate region is then a UMat view of it
+        source = self._to_umat(screenshot) if umats is not None else None
+        for x, y, w, h, _ in stats[1:count]:
+            x1 = max(0, int(x / scale) - pad)
+            y1 = max(0, int(y / scale) - pad)
+            x2 = min(screenshot_w, int((x + w) / scale) + template_w + pad)
+            y2 = min(screenshot_h, int((y + h) / scale) + template_h + pad)
+            if x2 - x1 < template_w or y2 - y1 < template_h:
+                continue
+            
+            if source is not None:
+                result = cv2.matchTemplate(cv2.UMat(source, (y1, y2), (x1, x2)), umats[1], cv2.TM_CCOEFF_NORMED)
+            else:
+                result = cv2.matchTemplate(screenshot[y1:y2, x1:x2], template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            if max_val > best_val:
+                best_val, best_loc = max_val, (x1 + max_loc[0], y1 + max_loc[1])
+        
+        return best_val, best_loc
+    
+    # The frame buffers are written in place and detections run on several threads (the PP detector,
+    # the hunt loop, the UI test buttons), so each thread gets its own set
+    @property
+    def _screen_f32(self):
+        return getattr(self._scratch, 'screen_f32', None)
+    
+    @_screen_f32.setter
+    def _screen_f32(self, value):
+        self._scratch.screen_f32 = value
+    
+    @property
+    def _last_screen(self):
+        return getattr(self._scratch, 'last_screen', None)
+    
+    @_last_screen.setter
+    def _last_screen(self, value):
+        self._scratch.last_screen = value
+    
+    @property
+    def _screen_u8(self):
+        return getattr(self._scratch, 'screen_u8', None)
+    
+    @_screen_u8.setter
+    def _screen_u8(self, value):
+        self._scratch.screen_u8 = value
+    
+    @property
+    def _coarse_result_bufs(self):
+        buffers = getattr(self._scratch, 'coarse_result_bufs', None)
+        if buffers is None:
+            buffers = self._scratch.coarse_result_bufs = {}
+        return buffers
+    
+    @_coarse_result_bufs.setter
+    def _coarse_result_bufs(self, value):
+        self._scratch.coarse_result_bufs = value
+    
+    def _to_gray(self, screenshot: np.ndarray) -> np.ndarray:
+        """Single-channel float32 copy of a BGR screenshot in [0, 1], converted once per screenshot"""
+        # The reference to the last screenshot keeps it alive, so an identity check is safe
+        if screenshot is self._last_screen:
+            return self._screen_f32
+        gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+        if self._screen_f32 is None or self._screen_f32.shape != gray.shape:
+            self._screen_f32 = np.empty(gray.shape, dtype=np.float32)
+        np.multiply(gray, 1.0 / 255.0, out=self._screen_f32, casting='unsafe')
+        self._screen_u8 = gray
+        self._last_screen = screenshot
+        return self._screen_f32
+    
+    def _coarse_level(self, gray: np.ndarray) -> np.ndarray:
+        """Downscale a grayscale image (uint8, or float32 in [0, 1]) to the uint8 coarse pyramid level"""
+        # The coarse pass only rejects/locates candidates, so it runs on 8-bit data: a quarter of the
+        # bytes of float32; the full-resolution confirmation stays float32
+        scale = self.pyramid_scale
+        small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        if small.dtype != np.uint8:
+            small = cv2.convertScaleAbs(small, alpha=255.0)  # Values are non-negative, so this just rescales + saturates
+        return small
+    
+    def _ahash(self, image: np.ndarray) -> int:
+        """64-bit average hash of a BGR image (8x8 grayscale, one bit per cell above the mean)"""
+        small = cv2.cvtColor(cv2.resize(image, (8, 8), interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        return int.from_bytes(np.packbits(small > small.mean()).tobytes(), 'big')
+    
     def test_all_templates(self, screenshot: np.ndarray) -> bool:
         """Test all loaded templates against the screenshot"""
         print(f"🧪 Testing all {len(self.templates)} loaded templates...")
@@ -434,6 +939,9 @@ class AutoHuntEngine:
         best_match = 0.0
         best_template = ""
         
+        # One grayscale conversion shared by every template
+        gray = self._to_gray(screenshot)
+        
         for template_name in self.templates.keys():
             # Check template size first to avoid OpenCV errors
             template = self.templates[template_name]
@@ -444,12 +952,11 @@ class AutoHuntEngine:
                 print(f"⚠ Template '{template_name}' ({template_w}x{template_h}) is larger than screenshot ({screenshot_w}x{screenshot_h}) - skipping")
                 continue
             
-            matched, location = self.detect_template(screenshot, template_name)
-            
-            # Get the actual confidence score for debugging
+            # One full-resolution match per template: its peak is both the decision and the debug score
             try:
-                result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
+                result = cv2.matchTemplate(gray, self._template_f32[template_name], cv2.TM_CCOEFF_NORMED)
                 min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
+                matched = max_val >= self.template_threshold
                 
                 if max_val > best_match:
                     best_match = max_val
@@ -470,6 +977,7 @@ class AutoHuntEngine:
         
         return any_match
     
+    @_timed('detect_battle_menu')
     def detect_battle_menu(self, screenshot: np.ndarray) -> bool:
         """Detect the 4-button battle menu using template matching (primary method)"""
         # Save debug screenshot first (only bottom area to avoid confusion)
@@ -716,21 +1224,11 @@ class AutoHuntEngine:
         try:
             import pytesseract
             from PIL import Image
-            import os
-            
-            # Try to set Tesseract path for common Windows installations
-            possible_paths = [
-                r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-                r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-                r'C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME', '')),
-                r'C:\tesseract\tesseract.exe'
-            ]
             
-            for path in possible_paths:
-                if os.path.exists(path):
-                    pytesseract.pytesseract.tesseract_cmd = path
-                    print(f"✓ Found Tesseract at: {path}")
-                    break
+            # Tesseract path for common Windows installations (probed once per process)
+            tesseract_cmd = _resolve_tesseract()
+            if tesseract_cmd:
+                pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
             
             # Convert OpenCV image to PIL Image
             screenshot_rgb = cv2.cvtColor(screenshot, cv2.COLOR_BGR2RGB)
@@ -813,45 +1311,44 @@ class AutoHuntEngine:
         
         return False
     
+    @_timed('detect_text_patterns')
     def detect_text_patterns(self, screenshot: np.ndarray) -> bool:
         """Detect text patterns without OCR - look for battle menu structures"""
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-            
             # Focus on bottom area where battle menu appears (from your screenshot)
-            height, width = gray.shape
+            height = screenshot.shape[0]
+            
+            # Battle menu is in bottom portion of screen - crop and downsample before converting
+            small_region, small_width, small_height = self._downsample_region(screenshot[int(height * 0.6):, :])  # Bottom 40% of screen
+            menu_region = cv2.cvtColor(small_region, cv2.COLOR_BGR2GRAY)
             
-            # Battle menu is in bottom portion of screen
-            menu_region = gray[int(height * 0.6):, :]  # Bottom 40% of screen
+            # Pixel-count thresholds shrink with the area, kernel widths with the width
+            factor = self.detection_downscale
+            area_scale = factor * factor
             
             # Look for white/light text on dark background
             _, text_mask = cv2.threshold(menu_region, 150, 255, cv2.THRESH_BINARY)
             
             # Count white pixels (text pixels)
             white_pixels = cv2.countNonZero(text_mask)
-            total_pixels = menu_region.size
+            total_pixels = small_width * small_height
             white_percentage = (white_pixels / total_pixels) * 100
             
             # Look for rectangular menu structures (like FIGHT, BAG, etc.)
-            # Find contours that could be menu buttons
-            contours, _ = cv2.findContours(text_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            # Count rectangular-ish contours (menu buttons)
-            menu_buttons = 0
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if area > 100:  # Minimum size for a menu button
-                    # Check if contour is roughly rectangular
-                    x, y, w, h = cv2.boundingRect(contour)
-                    aspect_ratio = w / h if h > 0 else 0
-                    if 0.5 < aspect_ratio < 4:  # Reasonable aspect ratio for buttons
-                        menu_buttons += 1
+            # Label connected blobs that could be menu buttons (labelling runs on the CPU)
+            component_mask = text_mask.get() if isinstance(text_mask, cv2.UMat) else text_mask
+            _, _, stats, _ = cv2.connectedComponentsWithStats(component_mask, connectivity=8)
+            
+            # Count rectangular-ish components (menu buttons), skipping the background label
+            stats = stats[1:]
+            widths = stats[:, cv2.CC_STAT_WIDTH]
+            heights = stats[:, cv2.CC_STAT_HEIGHT]
+            aspect_ratios = widths / np.maximum(heights, 1)
+            button_mask = (stats[:, cv2.CC_STAT_AREA] > 100 / area_scale) & (aspect_ratios > 0.5) & (aspect_ratios < 4)  # Minimum size + reasonable aspect ratio
+            menu_buttons = int(np.count_nonzero(button_mask))
             
             # Look for horizontal text lines (characteristic of menu text)
-            horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 1))
-            horizontal_lines = cv2.morphologyEx(text_mask, cv2.MORPH_OPEN, horizontal_kernel)
-            text_line_pixels = cv2.countNonZero(horizontal_lines)
+            text_line_pixels = self._count_horizontal_runs(text_mask, max(1, 25 // factor))
             
             # Debug output every 15 frames
             if not hasattr(self, 'pattern_debug_counter'):
@@ -865,7 +1362,7 @@ class AutoHuntEngine:
             # 1. Significant white text (menu text)
             # 2. Multiple button-like structures (FIGHT, BAG, etc.)
             # 3. Horizontal text lines
-            if white_percentage > 5 and menu_buttons >= 2 and text_line_pixels > 100:
+            if white_percentage > 5 and menu_buttons >= 2 and text_line_pixels > 100 / area_scale:
                 print(f"⚔️ Battle menu pattern detected! White: {white_percentage:.1f}%, Buttons: {menu_buttons}, Lines: {text_line_pixels}")
                 return True
                 
@@ -920,6 +1417,7 @@ class AutoHuntEngine:
         
         return False
     
+    @_timed('detect_encounter_text')
     def detect_encounter_text(self, screenshot: np.ndarray) -> bool:
         """Detect encounter text like 'A wild [Pokemon] appeared!'"""
         try:
@@ -943,9 +1441,7 @@ class AutoHuntEngine:
             _, thresh = cv2.threshold(bottom_area, 180, 255, cv2.THRESH_BINARY)
             
             # Look for horizontal text lines
-            horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (40, 1))
-            horizontal_lines = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, horizontal_kernel)
-            text_lines = cv2.countNonZero(horizontal_lines)
+            text_lines = self._count_horizontal_runs(thresh, 40)
             
             # Debug output every 30 frames
             if not hasattr(self, 'text_debug_counter'):
@@ -965,6 +1461,7 @@ class AutoHuntEngine:
         
         return False
     
+    @_timed('detect_visual_change')
     def detect_visual_change(self, screenshot: np.ndarray) -> bool:
         """Detect significant visual changes that indicate encounters (like reference bot)"""
         try:
@@ -975,12 +1472,13 @@ class AutoHuntEngine:
                 return False
             
             # Calculate difference between current and reference
-            diff = cv2.absdiff(screenshot, self.reference_screenshot)
+            diff = cv2.absdiff(self._to_umat(screenshot), self._to_umat(self.reference_screenshot))
             gray_diff = cv2.cvtColor(diff, cv2.COLOR_BGR2GRAY)
             
             # Calculate percentage of changed pixels
-            changed_pixels = np.sum(gray_diff > 30)  # Threshold for significant change
-            total_pixels = gray_diff.size
+            _, changed_mask = cv2.threshold(gray_diff, 30, 255, cv2.THRESH_BINARY)  # Threshold for significant change
+            changed_pixels = cv2.countNonZero(changed_mask)
+            total_pixels = screenshot.shape[0] * screenshot.shape[1]
             change_percentage = (changed_pixels / total_pixels) * 100
             
             # Debug output every 20 frames
@@ -1012,6 +1510,7 @@ class AutoHuntEngine:
         
         return False
     
+    @_timed('detect_center_dialog_debug')
     def detect_center_dialog_debug(self, screenshot: np.ndarray) -> bool:
         """Detect encounter dialog in center of screen with debug output"""
         try:
@@ -1036,7 +1535,9 @@ class AutoHuntEngine:
             x2 = min(width, x2)
             y2 = min(height, y2)
             
-            center_region = screenshot[y1:y2, x1:x2]
+            # Downsample the center region so Canny/morphology touch 1/16 of the pixels
+            center_region, small_width, small_height = self._downsample_region(screenshot[y1:y2, x1:x2])
+            region_pixels = small_width * small_height
             
             # Convert to grayscale for analysis
             gray = cv2.cvtColor(center_region, cv2.COLOR_BGR2GRAY)
@@ -1044,16 +1545,15 @@ class AutoHuntEngine:
             # Look for dialog box characteristics:
             # 1. High contrast edges (dialog borders)
             edges = cv2.Canny(gray, 50, 150)
-            edge_density = np.sum(edges > 0) / edges.size
+            edge_density = cv2.countNonZero(edges) / region_pixels
             
             # 2. Text-like patterns (horizontal lines)
-            horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 1))
-            horizontal_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel)
-            text_density = np.sum(horizontal_lines > 0) / horizontal_lines.size
+            text_density = self._count_horizontal_runs(edges, max(1, 25 // self.detection_downscale)) / region_pixels
             
             # 3. Check for dialog-like color patterns
             # Dialogs often have consistent background colors
-            color_variance = np.var(gray)
+            _, std_dev = cv2.meanStdDev(gray)
+            color_variance = float(std_dev[0][0]) ** 2
             
             # Debug output every 50 frames to avoid spam
             if not hasattr(self, 'debug_counter'):
@@ -1073,6 +1573,7 @@ class AutoHuntEngine:
         
         return False
     
+    @_timed('detect_center_dialog')
     def detect_center_dialog(self, screenshot: np.ndarray) -> bool:
         """Detect encounter dialog in center of screen"""
         try:
@@ -1097,7 +1598,9 @@ class AutoHuntEngine:
             x2 = min(width, x2)
             y2 = min(height, y2)
             
-            center_region = screenshot[y1:y2, x1:x2]
+            # Downsample the center region so Canny/morphology touch 1/16 of the pixels
+            center_region, small_width, small_height = self._downsample_region(screenshot[y1:y2, x1:x2])
+            region_pixels = small_width * small_height
             
             # Convert to grayscale for analysis
             gray = cv2.cvtColor(center_region, cv2.COLOR_BGR2GRAY)
@@ -1105,16 +1608,15 @@ class AutoHuntEngine:
             # Look for dialog box characteristics:
             # 1. High contrast edges (dialog borders)
             edges = cv2.Canny(gray, 50, 150)
-            edge_density = np.sum(edges > 0) / edges.size
+            edge_density = cv2.countNonZero(edges) / region_pixels
             
             # 2. Text-like patterns (horizontal lines)
-            horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 1))
-            horizontal_lines = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel)
-            text_density = np.sum(horizontal_lines > 0) / horizontal_lines.size
+            text_density = self._count_horizontal_runs(edges, max(1, 25 // self.detection_downscale)) / region_pixels
             
             # 3. Check for dialog-like color patterns
             # Dialogs often have consistent background colors
-            color_variance = np.var(gray)
+            _, std_dev = cv2.meanStdDev(gray)
+            color_variance = float(std_dev[0][0]) ** 2
             
             # If we detect dialog characteristics, it's likely an encounter
             # Higher thresholds to avoid false positives from grass patterns
@@ -1127,45 +1629,53 @@ class AutoHuntEngine:
         
         return False
     
+    @_timed('detect_pokemon_sprite')
     def detect_pokemon_sprite(self, screenshot: np.ndarray) -> bool:
         """Detect Pokemon sprite appearance in the center area"""
         try:
             # Convert to HSV for better color detection
-            hsv = cv2.cvtColor(screenshot, cv2.COLOR_BGR2HSV)
-            
-            # Define color ranges for typical Pokemon sprites
-            # Pokemon sprites often have distinct colors different from grass
-            
-            # Red/Pink range (like the Slowpoke in your image)
-            lower_red1 = np.array([0, 50, 50])
-            upper_red1 = np.array([10, 255, 255])
-            lower_red2 = np.array([170, 50, 50])
-            upper_red2 = np.array([180, 255, 255])
-            
-            # Blue range
-            lower_blue = np.array([100, 50, 50])
-            upper_blue = np.array([130, 255, 255])
-            
-            # Yellow range
-            lower_yellow = np.array([20, 50, 50])
-            upper_yellow = np.array([30, 255, 255])
-            
-            # Purple range
-            lower_purple = np.array([130, 50, 50])
-            upper_purple = np.array([170, 255, 255])
-            
-            # Create masks for each color range
-            mask_red1 = cv2.inRange(hsv, lower_red1, upper_red1)
-            mask_red2 = cv2.inRange(hsv, lower_red2, upper_red2)
-            mask_blue = cv2.inRange(hsv, lower_blue, upper_blue)
-            mask_yellow = cv2.inRange(hsv, lower_yellow, upper_yellow)
-            mask_purple = cv2.inRange(hsv, lower_purple, upper_purple)
-            
-            # Combine all masks
-            pokemon_mask = mask_red1 + mask_red2 + mask_blue + mask_yellow + mask_purple
-            
-            # Count non-zero pixels (Pokemon sprite pixels)
-            pokemon_pixels = cv2.countNonZero(pokemon_mask)
+            if NUMBA_AVAILABLE:
+                # Fused single pass over the HSV buffer - no intermediate masks
+                hsv = cv2.cvtColor(screenshot, cv2.COLOR_BGR2HSV)
+                pokemon_pixels = count_pokemon_pixels(hsv)
+            else:
+                hsv = cv2.cvtColor(self._to_umat(screenshot), cv2.COLOR_BGR2HSV)
+                
+                # Define color ranges for typical Pokemon sprites
+                # Pokemon sprites often have distinct colors different from grass
+                
+                # Red/Pink range (like the Slowpoke in your image)
+                lower_red1 = np.array([0, 50, 50])
+                upper_red1 = np.array([10, 255, 255])
+                lower_red2 = np.array([170, 50, 50])
+                upper_red2 = np.array([180, 255, 255])
+                
+                # Blue range
+                lower_blue = np.array([100, 50, 50])
+                upper_blue = np.array([130, 255, 255])
+                
+                # Yellow range
+                lower_yellow = np.array([20, 50, 50])
+                upper_yellow = np.array([30, 255, 255])
+                
+                # Purple range
+                lower_purple = np.array([130, 50, 50])
+                upper_purple = np.array([170, 255, 255])
+                
+                # Create masks for each color range
+                mask_red1 = cv2.inRange(hsv, lower_red1, upper_red1)
+                mask_red2 = cv2.inRange(hsv, lower_red2, upper_red2)
+                mask_blue = cv2.inRange(hsv, lower_blue, upper_blue)
+                mask_yellow = cv2.inRange(hsv, lower_yellow, upper_yellow)
+                mask_purple = cv2.inRange(hsv, lower_purple, upper_purple)
+                
+                # Combine all masks
+                pokemon_mask = cv2.bitwise_or(mask_red1, mask_red2)
+                for mask in (mask_blue, mask_yellow, mask_purple):
+                    pokemon_mask = cv2.bitwise_or(pokemon_mask, mask)
+                
+                # Count non-zero pixels (Pokemon sprite pixels)
+                pokemon_pixels = cv2.countNonZero(pokemon_mask)
             
             # If we detect a significant number of Pokemon-colored pixels in center area
             # (but not too many, as that would be the entire screen)
@@ -1204,8 +1714,8 @@ class AutoHuntEngine:
         
         return False
     
-    def execute_movement(self, direction: str):
-        """Execute a movement in the specified direction"""
+    def execute_movement(self, direction: str, blocking: bool = True):
+        """Execute a movement in the specified direction (non-blocking leaves the key held until its deadline)"""
         # First ensure we have the game window
         if not self.window_manager.game_hwnd:
             if not self.window_manager.find_game_window():
@@ -1237,66 +1747,34 @@ class AutoHuntEngine:
         # Use the same input method as macros (which works!)
         print(f"🎮 Pressing {key.upper()} key using macro method for {self.movement_duration}s")
         self.input_manager.press_key(key)
-        time.sleep(self.movement_duration)
-        self.input_manager.release_key(key)
-        print(f"🎮 Finished {key.upper()} key press")
-    
-    def send_key_to_window(self, key: str, duration: float):
-        """Send key directly to PokeMMO window using multiple methods"""
-        import win32api
-        import win32con
-        import win32gui
+        self._held_key = key
+        self._release_at = time.monotonic() + self.movement_duration
         
-        # Map keys to virtual key codes
-        key_map = {
-            'a': 0x41,  # VK_A
-            'd': 0x44,  # VK_D  
-            'w': 0x57,  # VK_W
-            's': 0x53,  # VK_S
-            'e': 0x45   # VK_E
-        }
+        if blocking:
+            self.wait_for_key_release()
+    
+    def release_held_key_if_due(self, force: bool = False) -> bool:
+        """Release the held movement key once its deadline has passed"""
+        if self._held_key is None:
+            return True
         
-        if key not in key_map:
-            print(f"❌ Unknown key: {key}")
-            return
+        if force or time.monotonic() >= self._release_at:
+            self.input_manager.release_key(self._held_key)
+            print(f"🎮 Finished {self._held_key.upper()} key press")
+            self._held_key = None
+            return True
         
-        vk_code = key_map[key]
+        return False
+    
+    def wait_for_key_release(self):
+        """Sleep until the held movement key's deadline and release it"""
+        if self._held_key is None:
+            return
         
-        try:
-            # Method 1: Try PostMessage first (more reliable for games)
-            print(f"  🎯 Sending {key.upper()} via PostMessage...")
-            win32api.PostMessage(self.window_manager.game_hwnd, win32con.WM_KEYDOWN, vk_code, 0)
-            time.sleep(duration)
-            win32api.PostMessage(self.window_manager.game_hwnd, win32con.WM_KEYUP, vk_code, 0)
-            print(f"  ✓ Sent {key.upper()} via PostMessage")
-            
-        except Exception as e1:
-            print(f"  ⚠ PostMessage failed: {e1}")
-            
-            try:
-                # Method 2: Fallback to SendMessage
-                print(f"  🎯 Trying SendMessage...")
-                win32api.SendMessage(self.window_manager.game_hwnd, win32con.WM_KEYDOWN, vk_code, 0)
-                time.sleep(duration)
-                win32api.SendMessage(self.window_manager.game_hwnd, win32con.WM_KEYUP, vk_code, 0)
-                print(f"  ✓ Sent {key.upper()} via SendMessage")
-                
-            except Exception as e2:
-                print(f"  ⚠ SendMessage failed: {e2}")
-                
-                try:
-                    # Method 3: Focus window and use global keybd_event
-                    print(f"  🎯 Trying focus + keybd_event...")
-                    win32gui.SetForegroundWindow(self.window_manager.game_hwnd)
-                    time.sleep(0.1)
-                    
-                    win32api.keybd_event(vk_code, 0, 0, 0)  # Key down
-                    time.sleep(duration)
-                    win32api.keybd_event(vk_code, 0, win32con.KEYEVENTF_KEYUP, 0)  # Key up
-                    print(f"  ✓ Sent {key.upper()} via keybd_event")
-                    
-                except Exception as e3:
-                    print(f"  ❌ All methods failed: {e3}")
+        remaining = self._release_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self.release_held_key_if_due(force=True)
     
     def get_next_movement_direction(self) -> str:
         """Get the next movement direction - alternate between A and D"""
@@ -1356,8 +1834,20 @@ class AutoHuntEngine:
             print(f"  ... and {len(windows) - 20} more windows")
         print()
     
-    def handle_encounter(self, screenshot: np.ndarray):
-        """Handle a detected encounter with improved logic and Pokemon analysis"""
+    def press_escape_sequence(self):
+        """Press E three times (100ms hold, 500ms gap) to run from a normal encounter"""
+        sent = 0
+        if hasattr(self.input_manager, 'press_sequence'):
+            sent = self.input_manager.press_sequence(['e', 'e', 'e'], hold_ms=100, gap_ms=500)
+        # Only redo the taps that didn't go out - replaying sent ones would act twice in battle
+        for i in range(sent, 3):
+            self.input_manager.press_key('e')
+            time.sleep(0.1)
+            self.input_manager.release_key('e')
+            time.sleep(0.5)
+    
+    def handle_encounter(self):
+        """Handle a detected encounter with improved logic and Pokemon analysis (captures its own full screenshot)"""
         self.encounters_found += 1
         
         if self.encounter_callback:
@@ -1367,6 +1857,7 @@ class AutoHuntEngine:
             })
         
         print("🏃 Analyzing encounter and determining action...")
+        cleanup_future = None
         
         # Wait a moment for the battle interface to appear
         time.sleep(1.5)
@@ -1396,64 +1887,77 @@ class AutoHuntEngine:
                     print("🎯 Executing horde-specific sequence (D-S-E)")
                     self.execute_horde_sequence()
                     
-                    # Wait 3 seconds after horde sequence
+                    # Wait 3 seconds after horde sequence (cleanup runs meanwhile)
                     print("⏳ Waiting 3 seconds after horde sequence...")
+                    cleanup_future = self._background_pool.submit(self.cleanup_encounter_screenshots)
                     time.sleep(3.0)
                     
                 else:
                     # Normal encounter - use standard E sequence
                     print("🎯 Normal encounter - pressing E exactly 3 times...")
-                    for i in range(3):
-                        print(f"   Pressing E ({i + 1}/3)")
-                        
-                        # Use the same input method as macros to press E
-                        self.input_manager.press_key('e')
-                        time.sleep(0.1)
-                        self.input_manager.release_key('e')
-                        
-                        # Short delay between E presses
-                        time.sleep(0.5)
+                    self.press_escape_sequence()
                     
                     print("✅ Finished pressing E 3 times")
                     
-                    # Wait exactly 7 seconds before allowing movement again
+                    # Wait exactly 7 seconds before allowing movement again (cleanup runs meanwhile)
                     print("⏳ Waiting 7 seconds before resuming movement...")
+                    cleanup_future = self._background_pool.submit(self.cleanup_encounter_screenshots)
                     time.sleep(7.0)
                 
             else:
                 print("⚠ Battle menu not clearly detected, proceeding with standard escape")
                 # Fallback to standard sequence if battle menu not detected
-                for i in range(3):
-                    self.input_manager.press_key('e')
-                    time.sleep(0.1)
-                    self.input_manager.release_key('e')
-                    time.sleep(0.5)
+                self.press_escape_sequence()
+                cleanup_future = self._background_pool.submit(self.cleanup_encounter_screenshots)
                 time.sleep(7.0)
         else:
             print("⚠ Could not capture screenshot, proceeding with standard escape")
             # Fallback sequence
-            for i in range(3):
-                self.input_manager.press_key('e')
-                time.sleep(0.1)
-                self.input_manager.release_key('e')
-                time.sleep(0.5)
+            self.press_escape_sequence()
+            cleanup_future = self._background_pool.submit(self.cleanup_encounter_screenshots)
             time.sleep(7.0)
         
         # Reset movement direction to 'a' after encounter
         self.current_direction = 'a'
         print("🔄 Reset movement direction to 'A'")
         
-        # Clean up encounter screenshots (ALWAYS delete images after encounter)
-        self.cleanup_encounter_screenshots()
+        # Clean up encounter screenshots (ALWAYS delete images after encounter) - the
+        # cleanup was started during the post-encounter wait, just make sure it finished
+        if cleanup_future is None:
+            self.cleanup_encounter_screenshots()
+        else:
+            try:
+                cleanup_future.result()
+            except Exception as e:
+                print(f"⚠ Background screenshot cleanup failed: {e}")
         
         print("🚀 Ready to resume hunting!")
     
+    def _probe_battle_roi(self) -> bool:
+        """Cheap battle-menu probe: hash the ROI and only run template matching when it changed"""
+        roi = self.capture_game_region(self._battle_menu_roi_rect(), reuse_buffer=True)
+        roi_hash = self._hash_region(roi) if roi is not None else None
+        if roi_hash is None or roi_hash == self._last_roi_hash:
+            return False
+        self._last_roi_hash = roi_hash
+        
+        # Match the battle-menu templates on the ROI itself; reuse the last result when it is
+        # visually identical. One grayscale conversion serves both the change gate and the matcher
+        gray = self._to_gray(roi)
+        if self._frame_unchanged(self._screen_u8):
+            return self._last_battle_result
+        self._last_battle_result = self.detect_battle_menu_fast(roi, gray)
+        return self._last_battle_result
+    
     def hunt_loop(self):
-        """Main hunting loop - New approach: Check for encounters every 10 moves"""
+        """Main hunting loop - probe the battle-menu area during and after every move"""
         print("🎯 Auto Hunt started!")
         self.hunt_start_time = time.time()
         loop_count = 0
         
+        # 1ms timer resolution so key holds and pauses don't overshoot by ~15ms
+        set_high_resolution_timer(True)
+        
         # Initialize move counter
         if not hasattr(self, 'move_counter'):
             self.move_counter = 0
@@ -1476,32 +1980,12 @@ class AutoHuntEngine:
                     time.sleep(0.5)
                     continue
                 
-                # Execute movement first
+                # Execute movement first - the key stays held until its deadline
                 direction = self.get_next_movement_direction()
-                self.execute_movement(direction)
+                self.execute_movement(direction, blocking=False)
                 self.move_counter += 1
                 
-                # Check for encounters every 10 moves
-                if self.move_counter % 10 == 0:
-                    print(f"🔍 Checking for encounters after {self.move_counter} moves...")
-                    
-                    # Wait a moment for any encounter animation to settle
-                    time.sleep(1.0)
-                    
-                    # Capture full game screen for battle menu detection
-                    screenshot = self.capture_full_game_screen()
-                    if screenshot is not None:
-                        if self.detect_battle_menu_fast(screenshot):
-                            print("🎉 Battle menu detected - encounter found!")
-                            self.handle_encounter(screenshot)
-                            
-                            # Reset move counter after encounter
-                            self.move_counter = 0
-                            continue
-                        else:
-                            print(f"✓ No encounter detected, continuing hunt... ({self.move_counter} total moves)")
-                
-                # Print movement status every 10 moves
+                # Do bookkeeping while the key is held instead of idling
                 if self.move_counter % 10 == 0:
                     print(f"🚶 Moving {direction.upper()} - Hunting... ({self.move_counter} moves)")
                 
@@ -1515,6 +1999,36 @@ class AutoHuntEngine:
                         'moves': self.move_counter
                     })
                 
+                # Probe the battle-menu area while the key is held, releasing it once its deadline passes
+                battle_detected = False
+                while not self.release_held_key_if_due():
+                    if self.stop_flag or self.is_paused:
+                        break
+                    if self._probe_battle_roi():
+                        battle_detected = True
+                        break
+                    time.sleep(max(0.0, min(self.hold_probe_interval, self._release_at - time.monotonic())))
+                self.release_held_key_if_due(force=True)
+                
+                # One more probe after the release - the encounter often starts right at the end of the step
+                if not battle_detected and not self.stop_flag:
+                    battle_detected = self._probe_battle_roi()
+                
+                if battle_detected:
+                    print("🎉 Battle menu detected - encounter found!")
+                    
+                    # handle_encounter grabs the full game screen itself once the encounter is confirmed
+                    self.handle_encounter()
+                    
+                    # Reset move counter and change gates after encounter
+                    self.move_counter = 0
+                    self._last_thumb = None
+                    self._last_roi_hash = None
+                    self._last_battle_result = False
+                    continue
+                elif self.move_counter % 10 == 0:
+                    print(f"✓ No encounter detected, continuing hunt... ({self.move_counter} total moves)")
+                
                 # Wait before next move
                 time.sleep(self.movement_pause)
                 
@@ -1524,6 +2038,10 @@ class AutoHuntEngine:
                     self.status_callback('error', str(e))
                 break
         
+        # Never leave a movement key stuck down
+        self.release_held_key_if_due(force=True)
+        set_high_resolution_timer(False)
+        
         # Hunt finished
         self.total_hunt_time += time.time() - self.hunt_start_time if self.hunt_start_time else 0
         print(f"🏁 Auto Hunt stopped. Total encounters: {self.encounters_found}, Total moves: {self.move_counter}")
@@ -1605,126 +2123,272 @@ class AutoHuntEngine:
             'encounters_per_hour': (self.encounters_found / (current_time / 3600)) if current_time > 0 else 0
         }
 
-    def _enhance_contrast(self, image, factor):
-        """Enhance image contrast for better OCR"""
-        from PIL import ImageEnhance
-        enhancer = ImageEnhance.Contrast(image)
-        return enhancer.enhance(factor)
-    
-    def _sharpen_image(self, image):
-        """Apply sharpening filter to image"""
-        from PIL import ImageFilter
-        return image.filter(ImageFilter.SHARPEN)
-    
-    def _denoise_image(self, image):
-        """Apply denoising to image"""
-        import cv2
-        import numpy as np
-        # Convert PIL to OpenCV format
-        cv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-        # Apply denoising
-        denoised = cv2.fastNlMeansDenoising(cv_image)
-        # Convert back to PIL
-        from PIL import Image
-        return Image.fromarray(cv2.cvtColor(denoised, cv2.COLOR_BGR2RGB)).convert('L')
-    
-    def _apply_threshold(self, image, method='binary'):
-        """Apply threshold to image for better text contrast"""
-        import cv2
-        import numpy as np
-        cv_image = np.array(image)
-        
+    def _enhance_contrast(self, image: np.ndarray, factor: float) -> np.ndarray:
+        """Enhance grayscale image contrast for better OCR"""
+        # Same pivot as PIL's ImageEnhance.Contrast (the image mean), applied as a 256-entry LUT
+        mean = int(cv2.mean(image)[0] + 0.5)
+        lut = np.clip((self._contrast_ramp - mean) * factor + mean + 0.5, 0, 255).astype(np.uint8)
+        return cv2.LUT(image, lut)
+    
+    def _sharpen_image(self, image: np.ndarray) -> np.ndarray:
+        """Apply sharpening filter to grayscale image"""
+        # PIL's ImageFilter.SHARPEN kernel as a single filter2D pass
+        return cv2.filter2D(image, -1, self._sharpen_kernel)
+    
+    def _denoise_image(self, image: np.ndarray) -> np.ndarray:
+        """Apply edge-preserving denoising to grayscale image"""
+        # Local 5x5 bilateral filter - game UI text is clean enough that the non-local
+        # patch search of fastNlMeansDenoising only costs time
+        return cv2.bilateralFilter(image, 5, 30, 30)
+    
+    def _apply_threshold(self, image: np.ndarray, method: str = 'binary') -> np.ndarray:
+        """Apply threshold to grayscale image for better text contrast"""
         if method == 'binary':
-            _, thresh = cv2.threshold(cv_image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            _, thresh = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         elif method == 'adaptive':
-            thresh = cv2.adaptiveThreshold(cv_image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+            thresh = cv2.adaptiveThreshold(image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
         else:
-            thresh = cv_image
-            
-        from PIL import Image
-        return Image.fromarray(thresh)
+            thresh = image
+        return thresh
     
-    def _morphology_cleanup(self, image):
-        """Apply morphological operations to clean up text"""
-        import cv2
-        import numpy as np
-        cv_image = np.array(image)
-        
+    def _morphology_cleanup(self, image: np.ndarray) -> np.ndarray:
+        """Apply morphological operations to clean up grayscale text"""
         # Create kernel
         kernel = np.ones((2,2), np.uint8)
         
         # Apply morphological operations
-        opening = cv2.morphologyEx(cv_image, cv2.MORPH_OPEN, kernel)
-        closing = cv2.morphologyEx(opening, cv2.MORPH_CLOSE, kernel)
-        
-        from PIL import Image
-        return Image.fromarray(closing)
+        opening = cv2.morphologyEx(image, cv2.MORPH_OPEN, kernel)
+        return cv2.morphologyEx(opening, cv2.MORPH_CLOSE, kernel)
 
+    def _ocr_mosaic(self, images: List[np.ndarray], config: str, side_by_side: bool = False) -> List[str]:
+        """OCR equally sized grayscale tiles in a single Tesseract call, returns the text of each tile
+        Tiles are stacked vertically, or placed side by side for single-line modes (PSM 7)"""
+        if not images:
+            return []
+        
+        # Put a blank band between the tiles so lines and words never merge across tiles
+        tile_height, tile_width = images[0].shape[:2]
+        if side_by_side:
+            separator = np.full((tile_height, self.ocr_mosaic_gap), 255, dtype=np.uint8)
+        else:
+            separator = np.full((self.ocr_mosaic_gap, tile_width), 255, dtype=np.uint8)
+        parts = []
+        for image in images:
+            parts.extend((image, separator))
+        mosaic = np.hstack(parts[:-1]) if side_by_side else np.vstack(parts[:-1])
+        
+        # Map every recognised word back to its tile by its position along the mosaic
+        data = pytesseract.image_to_data(mosaic, config=config, output_type=pytesseract.Output.DICT)
+        if side_by_side:
+            pitch = tile_width + self.ocr_mosaic_gap
+            starts, sizes = data['left'], data['width']
+        else:
+            pitch = tile_height + self.ocr_mosaic_gap
+            starts, sizes = data['top'], data['height']
+        tile_words = [[] for _ in images]
+        for word, start, size in zip(data['text'], starts, sizes):
+            word = word.strip()
+            if word:
+                tile = min(len(images) - 1, (start + size // 2) // pitch)
+                tile_words[tile].append(word)
+        
+        return [' '.join(words) for words in tile_words]
+    
+    def _ocr_name_pass(self, images: List[np.ndarray], psm: int) -> List[str]:
+        """One page segmentation mode over preprocessed name-area variants, returns the text of each
+        PSM 6 (block) and 7 (line) read every variant in one mosaic, PSM 8 (single word) reads them one by one"""
+        if psm == 8:
+            return [pytesseract.image_to_string(image, config=self._TESS_CFG8).strip() for image in images]
+        if psm == 7:
+            return self._ocr_mosaic(images, self._TESS_CFG7, side_by_side=True)
+        return self._ocr_mosaic(images, self._ocr_block_config)
+    
+    def _remember_ocr_result(self, cache_key, pokemon_names: List[str], is_horde: bool, contains_shiny: bool) -> Tuple[List[str], bool, bool]:
+        """Store a name-area OCR result in the LRU cache and return it"""
+        with self._ocr_cache_lock:
+            self._ocr_cache[cache_key] = (tuple(pokemon_names), is_horde, contains_shiny)
+            if len(self._ocr_cache) > self.ocr_cache_size:
+                self._ocr_cache.popitem(last=False)
+        return pokemon_names, is_horde, contains_shiny
+    
+    def _cached_ocr_result(self, cache_key) -> Optional[Tuple[List[str], bool, bool]]:
+        """Look up a name-area OCR result in the LRU cache"""
+        with self._ocr_cache_lock:
+            cached = self._ocr_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._ocr_cache.move_to_end(cache_key)
+        return list(cached[0]), cached[1], cached[2]
+    
+    def _name_area(self, screenshot: np.ndarray) -> np.ndarray:
+        """Crop of the Pokemon names area (custom detection area if set)"""
+        if hasattr(self, 'custom_detection_area') and self.custom_detection_area:
+            x1, y1, x2, y2 = self.custom_detection_area
+        else:
+            # Default coordinates for Pokemon names area
+            x1, y1, x2, y2 = 342, 153, 1553, 228
+        return screenshot[y1:y2, x1:x2]
+    
+    def _name_ocr_variants(self) -> List[Tuple[str, Any]]:
+        """Preprocessing ladder for name-area OCR, historically best variant first"""
+        variants = [
+            ("High Contrast", lambda img: self._enhance_contrast(img, 2.5)),
+            ("Medium Contrast", lambda img: self._enhance_contrast(img, 1.8)),
+            ("Sharpened", lambda img: self._sharpen_image(img)),
+            ("Threshold Binary", lambda img: self._apply_threshold(img, 'binary')),
+            ("Morphology Cleaned", lambda img: self._morphology_cleanup(img)),
+        ]
+        variants.sort(key=lambda variant: -self._ocr_variant_wins.get(variant[0], 0))
+        return variants
+    
+    def submit_ocr_frame(self, screenshot: np.ndarray, callback=None) -> bool:
+        """Queue a frame for batched name-area OCR; callback(pokemon_names, is_horde, contains_shiny) gets the result"""
+        if self._ocr_worker_thread is None:
+            with self._ocr_worker_lock:
+                if self._ocr_worker_thread is None:
+                    self._ocr_worker_thread = threading.Thread(target=self._ocr_worker_loop, daemon=True)
+                    self._ocr_worker_thread.start()
+        try:
+            self._ocr_queue.put_nowait((screenshot, callback))
+            return True
+        except queue.Full:
+            # Dropping is the intended back-pressure (the caller never waits on OCR), so only log it when asked
+            if self.verbose:
+                print("⚠ OCR queue full, skipping frame")
+            return False
+    
+    def _ocr_worker_loop(self):
+        """Collect submitted frames into batches and read each batch with detect_batch"""
+        while True:
+            frames = [self._ocr_queue.get()]
+            deadline = time.monotonic() + self.ocr_batch_timeout
+            while len(frames) < self.ocr_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    frames.append(self._ocr_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                results = self.detect_batch([screenshot for screenshot, _ in frames])
+                for (_, callback), result in zip(frames, results):
+                    if callback:
+                        callback(*result)
+            except Exception as e:
+                print(f"❌ Error in batched OCR: {e}")
+            finally:
+                for _ in frames:
+                    self._ocr_queue.task_done()
+    
+    def detect_batch(self, screenshots: List[np.ndarray]) -> List[Tuple[List[str], bool, bool]]:
+        """
+        Detect Pokemon names in several screenshots with one Tesseract run over all name areas
+        Returns: one (pokemon_names, is_horde, contains_shiny) per screenshot
+        """
+        results = [None] * len(screenshots)
+        pending = {}  # Crop shape -> [(index, cache key, grayscale crop)], mosaic tiles must match in size
+        for index, screenshot in enumerate(screenshots):
+            crop_region = self._name_area(screenshot)
+            if crop_region.size == 0:
+                results[index] = ([], False, False)
+                continue
+            cache_key = (self._hash_region(crop_region), crop_region.shape)
+            cached = self._cached_ocr_result(cache_key)
+            if cached is not None:
+                results[index] = cached
+                continue
+            pending.setdefault(crop_region.shape, []).append(
+                (index, cache_key, cv2.cvtColor(crop_region, cv2.COLOR_BGR2GRAY)))
+        
+        # Every tile gets the historically best preprocessing variant
+        _, prep_func = self._name_ocr_variants()[0]
+        for items in pending.values():
+            tile_texts = self._ocr_mosaic([prep_func(gray) for _, _, gray in items], self._ocr_block_config)
+            for (index, cache_key, _), ocr_text in zip(items, tile_texts):
+                if not ocr_text.strip():
+                    # Nothing legible in the name area (the normal case while walking) - that is the answer
+                    results[index] = self._remember_ocr_result(cache_key, [], False, False)
+                    continue
+                pokemon_names = self.extract_pokemon_names_working(ocr_text) if len(ocr_text) > 2 else []
+                filtered_names, is_horde, contains_shiny = self.apply_special_pokemon_filter(pokemon_names, ocr_text)
+                if filtered_names:
+                    results[index] = self._remember_ocr_result(cache_key, filtered_names, is_horde, contains_shiny)
+                else:
+                    # Best variant read text but no name - run the full ladder on this frame alone
+                    results[index] = self.detect_pokemon_names_top_screen(screenshots[index], max_retries=1)
+        
+        return results
+    
+    @_timed('detect_pokemon_names_top_screen')
     def detect_pokemon_names_top_screen(self, screenshot: np.ndarray, max_retries: int = 3) -> Tuple[List[str], bool, bool]:
         """
         Detect Pokemon names from the top screen area using enhanced OCR with retry logic
         Returns: (pokemon_names, is_horde, contains_shiny)
         """
         try:
-            # Use custom detection area if available, otherwise default coordinates
-            if hasattr(self, 'custom_detection_area') and self.custom_detection_area:
-                x1, y1, x2, y2 = self.custom_detection_area
-            else:
-                # Default coordinates for Pokemon names area
-                x1, y1, x2, y2 = 342, 153, 1553, 228
-            
-            # Crop the region
-            crop_region = screenshot[y1:y2, x1:x2]
+            # Crop the names region (custom detection area if set)
+            crop_region = self._name_area(screenshot)
             if crop_region.size == 0:
                 print("❌ Invalid crop region for Pokemon detection")
                 return [], False, False
             
+            # Identical name area as a previous read - reuse its result instead of re-running OCR
+            cache_key = (self._hash_region(crop_region), crop_region.shape)
+            cached = self._cached_ocr_result(cache_key)
+            if cached is not None:
+                print("♻️ Name area unchanged since a previous read - reusing OCR result")
+                return cached
+            
             # Save debug screenshot
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
             crop_filename = f"pokemon_names_precise_area_{timestamp}.png"
             crop_path = os.path.join(self.debug_dir, crop_filename)
-            cv2.imwrite(crop_path, crop_region)
+            self._queue_debug_write(crop_path, crop_region)
+            
+            # Convert once - every preprocessor reads this uint8 grayscale crop
+            gray_image = cv2.cvtColor(crop_region, cv2.COLOR_BGR2GRAY)
             
             # Try OCR multiple times until we get some meaningful text
             for attempt in range(max_retries):
-                # Enhanced preprocessing methods
-                preprocessing_methods = [
-                    ("High Contrast", lambda img: self._enhance_contrast(img, 2.5)),
-                    ("Medium Contrast", lambda img: self._enhance_contrast(img, 1.8)),
-                    ("Sharpened", lambda img: self._sharpen_image(img)),
-                    ("Threshold Binary", lambda img: self._apply_threshold(img, 'binary')),
-                    ("Morphology Cleaned", lambda img: self._morphology_cleanup(img)),
-                ]
-                
-                # OCR configurations
-                ocr_configs = [
-                    ("PSM 6", {"psm": 6, "oem": 3}),  # Block of text - works best
-                    ("PSM 7", {"psm": 7, "oem": 3}),  # Single text line
-                    ("PSM 8", {"psm": 8, "oem": 3}),  # Single word
-                ]
-                
+                # Historically best variant first; it is OCR'd alone and can short-circuit the rest
+                preprocessing_methods = self._name_ocr_variants()
                 all_ocr_results = []
                 
-                # Try each preprocessing method with each OCR config
-                for prep_name, prep_func in preprocessing_methods:
-                    try:
-                        processed_img = prep_func(crop_region.copy())
+                for batch in (preprocessing_methods[:1], preprocessing_methods[1:]):
+                    batch_names, batch_images = [], []
+                    for prep_name, prep_func in batch:
+                        try:
+                            batch_images.append(prep_func(gray_image))
+                            batch_names.append(prep_name)
+                        except Exception as e:
+                            continue  # Skip failed preprocessing
+                    
+                    # Same modes as the per-image ladder: PSM 6 (block of text, works best), 7 (line), 8 (word)
+                    for psm in (6, 7, 8):
+                        try:
+                            tile_texts = self._ocr_name_pass(batch_images, psm)
+                        except Exception as e:
+                            print(f"⚠️ OCR attempt {attempt + 1} (PSM {psm}) failed: {e}")
+                            continue
                         
-                        for config_name, config in ocr_configs:
-                            try:
-                                custom_config = f'--psm {config["psm"]} --oem {config["oem"]} -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
-                                
-                                # Get OCR text
-                                ocr_text = pytesseract.image_to_string(processed_img, config=custom_config).strip()
-                                
-                                if ocr_text and len(ocr_text) > 2:
-                                    all_ocr_results.append(ocr_text)
-                                        
-                            except Exception as e:
-                                continue  # Skip failed OCR attempts
-                                
-                    except Exception as e:
-                        continue  # Skip failed preprocessing
+                        for prep_name, ocr_text in zip(batch_names, tile_texts):
+                            if len(ocr_text) <= 2:
+                                continue
+                            all_ocr_results.append(ocr_text)
+                            
+                            # Confident single-variant read of normal Pokemon - stop here
+                            if len(ocr_text) > 8:
+                                pokemon_names = self.extract_pokemon_names_working(ocr_text)
+                                filtered_names, is_horde, contains_shiny = self.apply_special_pokemon_filter(pokemon_names, ocr_text)
+                                if (filtered_names and not contains_shiny and
+                                        all(name in self._normal_set for name in filtered_names)):
+                                    self._ocr_variant_wins[prep_name] = self._ocr_variant_wins.get(prep_name, 0) + 1
+                                    print(f"🎯 Pokemon detected on attempt {attempt + 1} ({prep_name})")
+                                    print(f"   Names found: {filtered_names}")
+                                    print(f"   Is Horde: {is_horde}")
+                                    return self._remember_ocr_result(cache_key, filtered_names, is_horde, contains_shiny)
                 
                 # Combine all OCR results
                 combined_text = ' '.join(all_ocr_results)
@@ -1742,7 +2406,7 @@ class AutoHuntEngine:
                         print(f"   Names found: {filtered_names}")
                         print(f"   Is Horde: {is_horde}")
                         print(f"   Contains Shiny: {contains_shiny}")
-                        return filtered_names, is_horde, contains_shiny
+                        return self._remember_ocr_result(cache_key, filtered_names, is_horde, contains_shiny)
                 
                 # If no valid Pokemon found, try again
                 if attempt < max_retries - 1:
@@ -1750,7 +2414,7 @@ class AutoHuntEngine:
             
             # If all retries failed, return empty result
             print(f"❌ No Pokemon detected after {max_retries} attempts")
-            return [], False, False
+            return self._remember_ocr_result(cache_key, [], False, False)
             
         except Exception as e:
             print(f"❌ Error in Pokemon name detection: {e}")
@@ -1762,16 +2426,25 @@ class AutoHuntEngine:
             return []
         
         # Clean and normalize text
-        cleaned_text = ''.join(c if c.isalpha() or c.isspace() else ' ' for c in raw_text)
-        cleaned_text = ' '.join(cleaned_text.split()).lower()
+        # Filtering and lowercasing in one bytes.translate pass over a 256-entry table
+        cleaned_text = ' '.join(raw_text.encode('latin-1', 'replace').translate(self._ocr_lut).decode('latin-1').split())
         
         # Count Pokemon occurrences for horde detection
         pokemon_counts = {}
         found_any_normal = False
         
-        # Check against each normal Pokemon name and count occurrences
-        for normal_pokemon in self.normal_pokemon_list:
-            count = self.count_pokemon_occurrences_working(normal_pokemon, cleaned_text)
+        # Single multi-pattern scan: word-bounded hits per name, and which names occur at all
+        if self._pokemon_automaton is not None:
+            exact_counts = self.count_exact_pokemon_hits(cleaned_text)
+            candidates = [name for name in self.normal_pokemon_list if name in exact_counts]
+        else:
+            exact_counts = {}
+            candidates = self._extract_fast(cleaned_text)
+        
+        # Check against each candidate Pokemon name and count occurrences
+        for normal_pokemon in candidates:
+            # Names with no word-bounded hit still get the substring checks below
+            count = exact_counts.get(normal_pokemon) or self.count_pokemon_occurrences_working(normal_pokemon, cleaned_text)
             if count > 0:
                 # For single Pokemon encounters, limit to 1 unless there are clear multiple instances
                 if count <= 2:
@@ -1789,15 +2462,21 @@ class AutoHuntEngine:
                     pokemon_counts[normal_pokemon] = 1
                     found_any_normal = True
         
-        # Convert counts back to list format for compatibility
-        detected_pokemon = []
-        for pokemon, count in pokemon_counts.items():
-            # Add the pokemon name 'count' times to the list for horde detection
-            for _ in range(count):
-                detected_pokemon.append(pokemon)
-        
-        return detected_pokemon
+        # Convert counts back to list format for compatibility - each name
+        # repeated 'count' times for horde detection
+        return list(Counter(pokemon_counts).elements())
 
+    def count_exact_pokemon_hits(self, text_lower: str) -> Dict[str, int]:
+        """Word-bounded hit count for every listed name found in the text, from one automaton pass"""
+        counts = {}
+        text_length = len(text_lower)
+        for end, name in self._pokemon_automaton.iter(text_lower):
+            start = end - len(name) + 1
+            bounded = ((start == 0 or not text_lower[start - 1].isalnum()) and
+                       (end + 1 == text_length or not text_lower[end + 1].isalnum()))
+            counts[name] = counts.get(name, 0) + bounded
+        return counts
+    
     def count_pokemon_occurrences_working(self, pokemon_name: str, text: str) -> int:
         """Count Pokemon occurrences using the working method"""
         if not pokemon_name or not text:
@@ -1806,10 +2485,11 @@ class AutoHuntEngine:
         pokemon_lower = pokemon_name.lower()
         text_lower = text.lower()
         
-        # Method 1: Exact word boundary matching
-        import re
-        pattern = r'\b' + re.escape(pokemon_lower) + r'\b'
-        exact_matches = len(re.findall(pattern, text_lower))
+        # Method 1: Exact word boundary matching (patterns precompiled per list update)
+        pattern = self._pokemon_patterns.get(pokemon_lower)
+        if pattern is None:
+            pattern = re.compile(r'\b' + re.escape(pokemon_lower) + r'\b')
+        exact_matches = len(pattern.findall(text_lower))
         
         if exact_matches > 0:
             return exact_matches
@@ -1849,41 +2529,117 @@ class AutoHuntEngine:
         # Method 2: Check if most characters of Pokemon name are present consecutively
         min_length = max(3, len(pokemon_lower) - 2)  # Allow up to 2 character differences
         
-        for i in range(len(text_lower) - min_length + 1):
-            for j in range(i + min_length, min(i + len(pokemon_lower) + 3, len(text_lower) + 1)):
-                substring = text_lower[i:j]
-                
-                # Calculate similarity
-                similarity = self.calculate_string_similarity_working(pokemon_lower, substring)
-                if similarity >= 0.7:  # 70% similarity threshold
-                    return True
+        # Every substring of length min_length..len+2 scored at once (70% similarity threshold)
+        if self._any_window_similar(pokemon_lower, text_lower, min_length, len(pokemon_lower) + 2, 0.7):
+            return True
         
         # Method 3: Check if Pokemon name characters appear in order (with gaps allowed)
-        pokemon_chars = list(pokemon_lower)
-        text_chars = list(text_lower)
+        if self._subsequence_matches(pokemon_lower, text_lower) * 5 >= len(pokemon_lower) * 4:  # 80% of characters must match in order
+            return True
+        
+        return False
+    
+    def _name_bytes(self, name_lower: str) -> np.ndarray:
+        """ASCII byte array of a lowercased name, cached for the listed Pokemon"""
+        name_bytes = self._pokemon_bytes.get(name_lower)
+        if name_bytes is None:
+            name_bytes = np.frombuffer(name_lower.encode('ascii', 'ignore'), dtype=np.uint8)
+        return name_bytes
+    
+    def _subsequence_matches(self, pokemon_lower: str, text_lower: str) -> int:
+        """Number of the name's characters that appear in order (gaps allowed) in the text"""
+        if not pokemon_lower:
+            return 0
+        
+        if NUMBA_AVAILABLE:
+            pokemon_bytes = self._name_bytes(pokemon_lower)
+            if len(pokemon_bytes) == 0:
+                return 0
+            text_bytes = np.frombuffer(text_lower.encode('ascii', 'ignore'), dtype=np.uint8)
+            return subsequence_matches(pokemon_bytes, text_bytes)
+        
+        text_length = len(text_lower)
+        if text_length > 32:
+            return self._subsequence_matches_indexed(pokemon_lower, text_lower)
         
         matches = 0
         text_index = 0
         
-        for char in pokemon_chars:
-            while text_index < len(text_chars):
-                if text_chars[text_index] == char:
+        for char in pokemon_lower:
+            while text_index < text_length:
+                text_index += 1
+                if text_lower[text_index - 1] == char:
                     matches += 1
-                    text_index += 1
                     break
-                text_index += 1
         
-        match_ratio = matches / len(pokemon_chars)
-        if match_ratio >= 0.8:  # 80% of characters must match in order
-            return True
+        return matches
+    
+    def _subsequence_matches_indexed(self, pokemon_lower: str, text_lower: str) -> int:
+        """Long-text variant of the in-order match: one binary search per name character"""
+        # Per-character position arrays are shared by every name checked against the same text
+        memo_text, codes, positions = self._subseq_memo
+        if memo_text != text_lower:
+            codes = np.frombuffer(text_lower.encode('utf-32-le'), dtype=np.uint32)
+            positions = {}
+            self._subseq_memo = (text_lower, codes, positions)
         
-        return False
+        matches = 0
+        text_index = 0
+        
+        for char in pokemon_lower:
+            char_positions = positions.get(char)
+            if char_positions is None:
+                char_positions = np.flatnonzero(codes == ord(char))
+                positions[char] = char_positions
+            
+            # First occurrence at or after the current index; a miss exhausts the text like the scan does
+            j = char_positions.searchsorted(text_index)
+            if j == len(char_positions):
+                break
+            text_index = char_positions[j] + 1
+            matches += 1
+        
+        return matches
 
+    def _name_histogram(self, pokemon_lower: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct byte values of a name and how often each occurs"""
+        hist = self._name_hists.get(pokemon_lower)
+        if hist is None:
+            name_bytes = np.frombuffer(pokemon_lower.encode('utf-8'), dtype=np.uint8)
+            hist = np.unique(name_bytes, return_counts=True)
+        return hist
+    
+    def _any_window_similar(self, pokemon_lower: str, text_lower: str, min_length: int, max_length: int, threshold: float) -> bool:
+        """True if any text substring of length min_length..max_length reaches the shared-character similarity threshold"""
+        text_bytes = np.frombuffer(text_lower.encode('utf-8'), dtype=np.uint8)
+        if len(text_bytes) < min_length:
+            return False
+        
+        # Running counts of each character of the name along the text (other characters never match)
+        chars, name_counts = self._name_histogram(pokemon_lower)
+        cumulative = np.zeros((len(chars), len(text_bytes) + 1), dtype=np.int32)
+        np.cumsum(text_bytes[None, :] == chars[:, None], axis=1, dtype=np.int32, out=cumulative[:, 1:])
+        
+        name_length = len(pokemon_lower)
+        for length in range(min_length, min(max_length, len(text_bytes)) + 1):
+            window_counts = cumulative[:, length:] - cumulative[:, :-length]
+            overlap = np.minimum(window_counts, name_counts[:, None]).sum(axis=0)
+            if np.any(2 * overlap >= threshold * (name_length + length)):
+                return True
+        
+        return False
+    
     def calculate_string_similarity_working(self, str1: str, str2: str) -> float:
         """Calculate similarity between two strings using simple character matching"""
         if not str1 or not str2:
             return 0.0
         
+        if NUMBA_AVAILABLE:
+            # Same multiset-overlap measure as below, compiled; no per-char list.remove()
+            a = np.frombuffer(str1.lower().encode('utf-8'), dtype=np.uint8)
+            b = np.frombuffer(str2.lower().encode('utf-8'), dtype=np.uint8)
+            return min(char_overlap_similarity(a, b), 1.0)
+        
         # Count matching characters
         str1_chars = list(str1.lower())
         str2_chars = list(str2.lower())
@@ -1905,9 +2661,6 @@ class AutoHuntEngine:
         if not pokemon_names:
             return [], False, False
         
-        # Define legendary Pokemon that can appear
-        legendary_pokemon = ['moltres', 'articuno', 'entei', 'zapdos', 'suicune', 'raikou']
-        
         # Check for shiny indicators
         contains_shiny = 'shiny' in raw_text.lower()
         
@@ -1915,7 +2668,7 @@ class AutoHuntEngine:
         is_horde = self.detect_horde_encounter_working(pokemon_names)
         
         # Check if we have any special encounters (shiny or legendary)
-        has_special = contains_shiny or any(pokemon in legendary_pokemon for pokemon in pokemon_names)
+        has_special = contains_shiny or not self._legendary_set.isdisjoint(pokemon_names)
         
         # If it's a special encounter, return as-is
         if has_special:
@@ -1924,7 +2677,7 @@ class AutoHuntEngine:
         # For normal encounters, check if all Pokemon are in the normal list
         valid_pokemon = []
         for pokemon in pokemon_names:
-            if pokemon in self.normal_pokemon_list:
+            if pokemon in self._normal_set:
                 valid_pokemon.append(pokemon)
         
         # If we found valid normal Pokemon, return them
@@ -1940,18 +2693,10 @@ class AutoHuntEngine:
         if len(pokemon_names) < 2:
             return False
         
-        # Count occurrences of each Pokemon name
-        name_counts = {}
-        for name in pokemon_names:
-            name_counts[name] = name_counts.get(name, 0) + 1
-        
-        # Check if any Pokemon appears 2+ times
-        for name, count in name_counts.items():
-            if count >= 2:
-                return True
-        
-        return False
+        # Check if the most frequent Pokemon appears 2+ times
+        return Counter(pokemon_names).most_common(1)[0][1] >= 2
 
+    @_timed('analyze_encounter_for_pokemon')
     def analyze_encounter_for_pokemon(self, screenshot: np.ndarray) -> Tuple[bool, str]:
         """
         Analyze encounter for Pokemon using simple OCR detection (same as working test button)
@@ -1975,7 +2720,7 @@ class AutoHuntEngine:
                 print(f"✅ Pokemon detected: {pokemon_name} (confidence: {confidence:.3f})")
                 
                 # Check if this is a target Pokemon
-                is_target = pokemon_name.lower() not in self.normal_pokemon_list
+                is_target = pokemon_name.lower() not in self._normal_set
                 
                 if is_horde:
                     print(f"🎯 HORDE encounter detected: {pokemon_name}")
@@ -2032,24 +2777,8 @@ class AutoHuntEngine:
         if len(word_lower) < len(pokemon_lower):
             return False
         
-        # Check if most characters of Pokemon name are present in order
-        pokemon_chars = list(pokemon_lower)
-        word_chars = list(word_lower)
-        
-        matches = 0
-        word_index = 0
-        
-        for char in pokemon_chars:
-            while word_index < len(word_chars):
-                if word_chars[word_index] == char:
-                    matches += 1
-                    word_index += 1
-                    break
-                word_index += 1
-        
-        # If most characters match in order, consider it a match
-        match_ratio = matches / len(pokemon_chars)
-        if match_ratio >= 0.8:  # 80% of characters must match for fuzzy word matching
+        # If most characters of Pokemon name are present in order, consider it a match
+        if self._subsequence_matches(pokemon_lower, word_lower) * 5 >= len(pokemon_lower) * 4:  # 80% of characters must match for fuzzy word matching
             return True
         
         return False
@@ -2084,36 +2813,19 @@ class AutoHuntEngine:
         self.show_special_encounter_popup(pokemon_names, is_shiny, message)
 
     def show_special_encounter_popup(self, pokemon_names: List[str], is_shiny: bool, message: str):
-        """Show popup notification for special encounters"""
+        """Queue a popup notification for special encounters (the UI thread shows it)"""
         try:
-            import tkinter as tk
-            from tkinter import messagebox
-            import threading
+            title = "✨ SHINY POKEMON!" if is_shiny else "🎯 SPECIAL ENCOUNTER!"
+            pokemon_list_str = ', '.join(pokemon_names).upper()
             
-            def show_popup():
-                root = tk.Tk()
-                root.withdraw()
-                
-                title = "✨ SHINY POKEMON!" if is_shiny else "🎯 SPECIAL ENCOUNTER!"
-                pokemon_list_str = ', '.join(pokemon_names)
-                
-                popup_message = f"{message}\n\n"
-                if is_shiny:
-                    popup_message += f"🌟 SHINY {pokemon_list_str.upper()} detected!\n"
-                    popup_message += "🎉 Extremely rare encounter!\n\n"
-                else:
-                    popup_message += f"🎯 {pokemon_list_str.upper()} not in normal list!\n"
-                    popup_message += "📊 Special encounter detected!\n\n"
-                
-                popup_message += "⚠️ Hunt has been PAUSED.\n"
-                popup_message += "📁 Screenshot saved in debug_screenshots.\n"
-                popup_message += "🎮 Check your game!"
-                
-                messagebox.showinfo(title, popup_message)
-                root.destroy()
+            if is_shiny:
+                details = [f"🌟 SHINY {pokemon_list_str} detected!", "🎉 Extremely rare encounter!"]
+            else:
+                details = [f"🎯 {pokemon_list_str} not in normal list!", "📊 Special encounter detected!"]
+            popup_message = "\n".join([message, "", *details, "", self._POPUP_SUFFIX])
             
-            popup_thread = threading.Thread(target=show_popup, daemon=True)
-            popup_thread.start()
+            # Tk may only be used from the thread running its main loop, which polls this queue
+            self.popup_queue.put((title, popup_message))
             
         except Exception as e:
             print(f"❌ Error showing popup: {e}")
@@ -2125,63 +2837,126 @@ class AutoHuntEngine:
     def update_normal_pokemon_list(self, pokemon_list: List[str]):
         """Update the list of normal Pokemon for current location"""
         self.normal_pokemon_list = [p.lower() for p in pokemon_list]
+        self._rebuild_pokemon_lookups()
         print(f"✅ Updated normal Pokemon list: {self.normal_pokemon_list}")
+    
+    def _rebuild_pokemon_lookups(self):
+        """Precompute per-name matching structures for the current normal Pokemon list"""
+        self._normal_set = frozenset(self.normal_pokemon_list)
+        self._pokemon_bytes = {name: np.frombuffer(name.encode('ascii', 'ignore'), dtype=np.uint8)
+                               for name in self.normal_pokemon_list}
+        self._name_hists = {name: np.unique(np.frombuffer(name.encode('utf-8'), dtype=np.uint8), return_counts=True)
+                            for name in self.normal_pokemon_list}
+        
+        # Cached OCR results were filtered against the old list
+        if hasattr(self, '_ocr_cache'):
+            self._ocr_cache.clear()
+        self._pokemon_patterns = {name: re.compile(r'\b' + re.escape(name) + r'\b')
+                                  for name in self.normal_pokemon_list}
+        
+        # Location-specialised substring prefilter: one unrolled `in` test per listed name
+        source = "def _extract_fast(text):\n    found = []\n"
+        for name in self.normal_pokemon_list:
+            source += f"    if {name!r} in text:\n        found.append({name!r})\n"
+        source += "    return found\n"
+        namespace = {}
+        exec(compile(source, "<extract_fast>", "exec"), namespace)
+        self._extract_fast = namespace['_extract_fast']
+        
+        # Aho-Corasick automaton: finds every listed name in one pass over the text
+        self._pokemon_automaton = None
+        if AHOCORASICK_AVAILABLE and self.normal_pokemon_list:
+            automaton = ahocorasick.Automaton()
+            for name in self.normal_pokemon_list:
+                automaton.add_word(name, name)
+            automaton.make_automaton()
+            self._pokemon_automaton = automaton
 
     def get_encounter_statistics(self) -> Dict[str, Any]:
         """Get enhanced statistics including special encounters"""
-        base_stats = self.get_statistics()
-        base_stats.update({
+        return {
+            **self.get_statistics(),
             'special_encounters': self.special_encounters_found,
             'shiny_encounters': self.shiny_encounters_found,
             'horde_encounters': self.horde_encounters_found,
             'last_detected_pokemon': self.last_detected_pokemon,
             'last_encounter_type': self.last_encounter_type
-        })
-        return base_stats
+        }
 
     def execute_horde_sequence(self):
         """Execute D-S-E sequence for horde encounters"""
         print("🎮 Executing horde sequence: D → S → E")
         
-        # Press D
-        print("   Pressing D key")
-        self.input_manager.press_key('d')
-        time.sleep(0.1)
-        self.input_manager.release_key('d')
-        time.sleep(0.5)
-        
-        # Press S
-        print("   Pressing S key")
-        self.input_manager.press_key('s')
-        time.sleep(0.1)
-        self.input_manager.release_key('s')
-        time.sleep(0.5)
-        
-        # Press E
-        print("   Pressing E key")
-        self.input_manager.press_key('e')
-        time.sleep(0.1)
-        self.input_manager.release_key('e')
+        # (key, hold, pause after) - sent through SendInput when the input manager supports it. Every step
+        # is held, so each press and release is still its own SendInput call; nothing here gets batched
+        steps = [('d', 0.1, 0.5), ('s', 0.1, 0.5), ('e', 0.1, 0.0)]
+        sent = 0
+        if hasattr(self.input_manager, 'send_sequence'):
+            sent = self.input_manager.send_sequence(steps)
+        # Only redo the steps that didn't go out, so D-S-E is never sent twice
+        for key, hold, gap in steps[sent:]:
+            self.input_manager.press_key(key)
+            time.sleep(hold)
+            self.input_manager.release_key(key)
+            time.sleep(gap)
         
         print("✅ Horde sequence (D-S-E) completed")
 
-    def detect_battle_menu_fast(self, screenshot: np.ndarray) -> bool:
-        """Fast battle menu detection using template matching only (no pokecenter check)"""
+    @_timed('detect_battle_menu_fast')
+    def detect_battle_menu_fast(self, screenshot: np.ndarray, gray: Optional[np.ndarray] = None,
+                                small: Optional[np.ndarray] = None, template_names: Optional[list] = None) -> bool:
+        """Fast battle menu detection using template matching only (no pokecenter check)
+        
+        gray / small are optional precomputed _to_gray conversion and coarse level of the same screenshot.
+        template_names overrides the templates checked (default: the two battle menu templates).
+        """
         try:
             # Only check battle menu templates, skip pokecenter templates
-            battle_templates = [
+            battle_templates = template_names if template_names is not None else [
                 'battle_menu',
                 'battle_menu_example'
             ]
             
+            # aHash gate: where a menu was confirmed before, skip matching while that area looks different
+            loaded_templates = [name for name in battle_templates if name in self._template_pyramid]
+            gated = 0
+            now = time.monotonic()
+            if loaded_templates and now - self._battle_hash_last_full < self.battle_hash_recheck:
+                for template_name in loaded_templates:
+                    reference = self._battle_hash_refs.get((template_name, screenshot.shape[:2]))
+                    if reference is None:
+                        break
+                    (x, y), reference_hash = reference
+                    template_h, template_w = self.templates[template_name].shape[:2]
+                    distance = bin(self._ahash(screenshot[y:y + template_h, x:x + template_w]) ^ reference_hash).count('1')
+                    if distance <= self.battle_hash_max_distance:
+                        break
+                    gated += 1
+                if gated == len(loaded_templates):
+                    return False
+            self._battle_hash_last_full = now
+            
+            frame = None
             for template_name in battle_templates:
-                if template_name in self.templates:
-                    detected, location = self.detect_template(screenshot, template_name)
-                    if detected:
-                        print(f"✅ Battle menu detected using template: {template_name}")
+                if template_name in self._template_pyramid:
+                    small_template, template = self._template_pyramid[template_name]
+                    if frame is None:
+                        # Convert and downscale the frame once, shared by every template
+                        frame = gray if gray is not None else self._to_gray(screenshot)
+                        if small is None:
+                            small = self._coarse_level(self._screen_u8 if frame is self._screen_f32 else frame)
+                    confidence, location = self._match_template_pyramid(frame, template, small_template, small,
+                                                                        template_name)
+                    if confidence >= self.template_threshold:
+                        print(f"✅ Battle menu detected using template: {template_name} ({confidence:.3f} at {location})")
+                        x, y = location
+                        template_h, template_w = template.shape[:2]
+                        self._battle_hash_refs[(template_name, screenshot.shape[:2])] = (
+                            location, self._ahash(screenshot[y:y + template_h, x:x + template_w]))
                         return True
             
-            print("❌ No battle menu templates matched")
+            if self.verbose:
+                print("❌ No battle menu templates matched")
             return False
             
         except Exception as e:
@@ -2414,9 +3189,9 @@ class AutoHuntEngine:
                 
                 # Multiple OCR configurations for better detection
                 ocr_configs = [
-                    r'--oem 3 --psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ',
-                    r'--oem 3 --psm 7 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ',
-                    r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+                    self._TESS_CFG8,
+                    self._TESS_CFG7,
+                    self._TESS_CFG6
                 ]
                 
                 for config in ocr_configs:
@@ -2463,12 +3238,12 @@ class AutoHuntEngine:
                 should_continue = False  # Stop hunting for shiny
                 print(f"🛑 SHINY {pokemon_name.upper()} encounter - stopping hunt!")
                 
-            elif pokemon_name.lower() in ['moltres', 'articuno', 'entei', 'zapdos', 'suicune', 'raikou']:
+            elif pokemon_name.lower() in self._legendary_set:
                 encounter_type = "legendary" 
                 should_continue = False  # Stop hunting for legendary
                 print(f"🛑 LEGENDARY {pokemon_name.upper()} encounter - stopping hunt!")
                 
-            elif pokemon_name.lower() not in [p.lower() for p in self.normal_pokemon_list]:
+            elif pokemon_name.lower() not in self._normal_set:
                 encounter_type = "special"
                 should_continue = False  # Stop hunting for special Pokemon
                 print(f"🛑 SPECIAL {pokemon_name.upper()} encounter - stopping hunt!")
@@ -2607,8 +3382,6 @@ class AutoHuntEngine:
         
         try:
             import pytesseract
-            from PIL import Image
-            import os
             
             # Get custom area coordinates
             left, top, right, bottom = self.custom_detection_area
@@ -2620,53 +3393,43 @@ class AutoHuntEngine:
             custom_region = screenshot[top:bottom, left:right]
             
             # Save debug screenshot of the custom area with a highlighted border
+            # (half resolution is plenty to check placement, and avoids a full-frame copy)
             import cv2
-            debug_screenshot = screenshot.copy()
-            cv2.rectangle(debug_screenshot, (left, top), (right, bottom), (0, 255, 0), 3)
+            debug_screenshot = cv2.resize(screenshot, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+            cv2.rectangle(debug_screenshot, (left // 2, top // 2), (right // 2, bottom // 2), (0, 255, 0), 2)
             self.save_debug_screenshot(debug_screenshot, "custom_area_test_full")
             
             # Save just the selected area
             self.save_debug_screenshot(custom_region, "custom_area_test_region")
             
-            # Convert to PIL for OCR
-            region_rgb = cv2.cvtColor(custom_region, cv2.COLOR_BGR2RGB)
-            pil_region = Image.fromarray(region_rgb)
-            
-            # Try to set Tesseract path
-            possible_paths = [
-                r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-                r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-                r'C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe'.format(os.getenv('USERNAME', '')),
-            ]
-            
-            for path in possible_paths:
-                if os.path.exists(path):
-                    pytesseract.pytesseract.tesseract_cmd = path
-                    break
-            
-            # Apply multiple OCR approaches
-            results = []
-            
-            # Enhanced contrast version
-            gray_image = pil_region.convert('L')
-            from PIL import ImageEnhance
-            enhancer = ImageEnhance.Contrast(gray_image)
-            enhanced_image = enhancer.enhance(3.0)
-            
-            # Approach 1: High contrast with character filtering
-            config1 = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
-            text1 = pytesseract.image_to_string(enhanced_image, config=config1).strip()
-            results.append(("High Contrast", text1))
-            
-            # Approach 2: Single line mode
-            config2 = r'--oem 3 --psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
-            text2 = pytesseract.image_to_string(enhanced_image, config=config2).strip()
-            results.append(("Single Line", text2))
-            
-            # Approach 3: Raw text without enhancement
-            config3 = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
-            text3 = pytesseract.image_to_string(pil_region, config=config3).strip()
-            results.append(("Raw Image", text3))
+            # Grayscale straight from BGR into a reused buffer (no RGB/PIL round trip)
+            region_shape = custom_region.shape[:2]
+            if self._ocr_buf is None or self._ocr_buf.shape != region_shape:
+                self._ocr_buf = np.empty(region_shape, dtype=np.uint8)
+            gray_image = cv2.cvtColor(custom_region, cv2.COLOR_BGR2GRAY, dst=self._ocr_buf)
+            
+            # Tesseract path was resolved once in _setup_tesseract
+            if self._tesseract_cmd:
+                pytesseract.pytesseract.tesseract_cmd = self._tesseract_cmd
+            
+            # Enhanced contrast version (same mean pivot as ImageEnhance.Contrast)
+            enhanced_image = self._enhance_contrast(gray_image, 3.0)
+            
+            tess_api = self._get_tess_api()
+            if tess_api is not None:
+                # In-process engine keeps the model resident - no tesseract.exe launch per variant
+                height, width = region_shape
+                texts = []
+                for image in (enhanced_image, gray_image):
+                    tess_api.SetImageBytes(image.tobytes(), width, height, 1, width)
+                    texts.append(tess_api.GetUTF8Text().strip())
+                text1, text3 = texts
+            else:
+                # Both variants (high contrast and raw) read in one Tesseract call, stacked as a mosaic.
+                # The old psm 8 pass re-read the high contrast image and is covered by psm 6.
+                config = self._TESS_CFG6
+                text1, text3 = self._ocr_mosaic([enhanced_image, gray_image], config)
+            results = [("High Contrast", text1), ("Raw Image", text3)]
             
             print(f"\n📋 OCR Results from Custom Area:")
             for approach, text in results:
@@ -2692,9 +3455,9 @@ class AutoHuntEngine:
                     
                     if contains_shiny:
                         print("   ✨ SHINY encounter detected!")
-                    elif any(p in ['moltres', 'articuno', 'entei', 'zapdos', 'suicune', 'raikou'] for p in filtered_names):
+                    elif not self._legendary_set.isdisjoint(filtered_names):
                         print("   🔥 LEGENDARY encounter detected!")
-                    elif filtered_names[0] not in self.normal_pokemon_list and filtered_names[0] != "shiny_unknown":
+                    elif filtered_names[0] not in self._normal_set and filtered_names[0] != "shiny_unknown":
                         print("   🎯 SPECIAL encounter detected!")
                     else:
                         print("   ✅ Normal encounter detected")
@@ -2865,9 +3628,9 @@ class AutoHuntEngine:
             
             # Multiple OCR configurations for Pokemon names
             ocr_configs = [
-                r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ',
-                r'--oem 3 --psm 7 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ',
-                r'--oem 3 --psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+                self._TESS_CFG6,
+                self._TESS_CFG7,
+                self._TESS_CFG8
             ]
             
             detected_names = []
@@ -2968,7 +3731,7 @@ class AutoHuntEngine:
             enhanced = enhancer.enhance(3.0)
             
             # OCR configuration for shiny detection
-            config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+            config = self._TESS_CFG6
             ocr_text = pytesseract.image_to_string(enhanced, config=config).strip().lower()
             
             # Check for shiny indicators
@@ -2994,12 +3757,12 @@ class AutoHuntEngine:
             
             # Save left text area
             left_path = os.path.join(self.debug_dir, f"{prefix}_left_text_{timestamp}.png")
-            cv2.imwrite(left_path, left_text_area)
+            self._queue_debug_write(left_path, left_text_area)
             print(f"   💾 Saved left text area: {left_path}")
             
             # Save right sprite area  
             right_path = os.path.join(self.debug_dir, f"{prefix}_right_sprite_{timestamp}.png")
-            cv2.imwrite(right_path, right_sprite_area)
+            self._queue_debug_write(right_path, right_sprite_area)
             print(f"   💾 Saved right sprite area: {right_path}")
             
             return left_path, right_path
@@ -3051,17 +3814,17 @@ class AutoHuntEngine:
             enhanced_image = enhancer.enhance(3.0)
             
             # Approach 1: High contrast with character filtering
-            config1 = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+            config1 = self._TESS_CFG6
             text1 = pytesseract.image_to_string(enhanced_image, config=config1).strip()
             results.append(("High Contrast", text1))
             
             # Approach 2: Single line mode
-            config2 = r'--oem 3 --psm 8 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+            config2 = self._TESS_CFG8
             text2 = pytesseract.image_to_string(enhanced_image, config=config2).strip()
             results.append(("Single Line", text2))
             
             # Approach 3: Raw text without enhancement
-            config3 = r'--oem 3 --psm 6 -c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+            config3 = self._TESS_CFG6
             text3 = pytesseract.image_to_string(pil_region, config=config3).strip()
             results.append(("Raw Image", text3))
             
@@ -3121,6 +3884,38 @@ class AutoHuntEngine:
             print("💡 Debug mode will provide detailed pokecenter escape detection")
             print("   This helps if you get stuck in Pokecenter animations or transitions")
         
+    def set_debug_metrics(self, enabled: bool):
+        """Enable/disable per-stage latency metrics"""
+        self.debug_metrics = enabled
+        self._metrics.clear()
+        self._metrics_last_report = time.monotonic()
+        print(f"🔧 Debug metrics: {'Enabled' if enabled else 'Disabled'}")
+    
+    def _record_metric(self, name: str, elapsed_ns: int):
+        """Accumulate one stage timing and print the summary table when it's due"""
+        entry = self._metrics.get(name)
+        if entry is None:
+            entry = self._metrics[name] = [0, 0, 0, deque(maxlen=200)]
+        entry[0] += 1
+        entry[1] += elapsed_ns
+        entry[2] = max(entry[2], elapsed_ns)
+        entry[3].append(elapsed_ns)
+        
+        now = time.monotonic()
+        if now - self._metrics_last_report >= self.metrics_interval:
+            self._metrics_last_report = now
+            self.print_metrics_summary()
+    
+    def print_metrics_summary(self):
+        """Print call count and P50/P99/max latency for every timed stage"""
+        print("📊 Stage latency (ms):")
+        for name, (count, total_ns, max_ns, samples) in sorted(self._metrics.items()):
+            ordered = sorted(samples)
+            p50 = ordered[len(ordered) // 2] / 1e6
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] / 1e6
+            print(f"   {name:<32} n={count:<6} avg={total_ns / count / 1e6:7.2f} "
+                  f"p50={p50:7.2f} p99={p99:7.2f} max={max_ns / 1e6:7.2f}")
+    
     def detect_pokecenter_stuck_debug(self, screenshot: np.ndarray) -> bool:
         """
         Enhanced pokecenter detection with debug output
@@ -3178,6 +3973,8 @@ class TemplateManager:
     
     def __init__(self):
         self.template_dir = "templates"
+        self._cached_mtime = None  # Directory st_mtime_ns the cached listing was taken at
+        self._cached_list = []
         self.ensure_template_directory()
     
     def ensure_template_directory(self):
@@ -3201,10 +3998,15 @@ class TemplateManager:
     
     def list_templates(self) -> List[str]:
         """List all available templates"""
-        import os
-        templates = []
-        if os.path.exists(self.template_dir):
-            for file in os.listdir(self.template_dir):
-                if file.endswith('.png'):
-                    templates.append(file[:-4])  # Remove .png extension
-        return templates 
\ No newline at end of file
+        import glob
+        try:
+            mtime = os.stat(self.template_dir).st_mtime_ns
+        except OSError:
+            return []
+        
+        # Adding/removing a file bumps the directory mtime; otherwise reuse the last listing
+        if mtime != self._cached_mtime:
+            self._cached_list = [os.path.splitext(os.path.basename(path))[0]
+                                 for path in glob.glob(os.path.join(self.template_dir, '*.png'))]
+            self._cached_mtime = mtime
+        return list(self._cached_list)
\ No newline at end of file
@@ -8,8 +8,14 @@ import os
 import json
 import cv2
 import numpy as np
-from PIL import Image, ImageGrab
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
+from auto_hunt import AutoHuntEngine, MSS_AVAILABLE
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class PPAutoHuntEngine:
@@ -27,14 +33,19 @@ class PPAutoHuntEngine:
             print("✅ PP Hunt: Using shared AutoHuntEngine instance (custom detection area will be preserved)")
         else:
             # Create an AutoHuntEngine instance for battle detection (fallback)
-            from auto_hunt import AutoHuntEngine
             self.auto_hunt_engine = AutoHuntEngine(window_manager, input_manager)
             print("⚠️ PP Hunt: Created new AutoHuntEngine instance (custom detection area may not be shared)")
         
+        # OpenCV threading for the per-poll matches (re-evaluated when a hunt starts)
+        self.small_roi_pixels = 50000  # Below this ROI size the thread pool costs more than it saves
+        self.cv_threads = 2  # OpenCV worker threads for larger ROIs (capped by the CPU count), the game needs the rest
+        self._configure_opencv_threads()
+        
         # Hunt state
         self.is_hunting = False
         self.is_paused = False
         self.stop_flag = False
+        self._interrupt_event = threading.Event()  # Set on stop/pause to wake interruptible_sleep
         self.hunt_thread = None
         
         # PP Hunt configuration
@@ -54,6 +65,29 @@ class PPAutoHuntEngine:
         self.encounter_loop_duration = 12.0  # Duration for E+E or X+E loop
         self.encounter_loop_type = 'e+e'  # 'e+e' or 'x+e'
         self.encounter_loop_interval = 0.3  # Interval between key combinations in loop
+        self.short_sleep_max = 0.15  # Sleeps up to this long skip the stop/pause event wait
+        self.verbose = False  # Per-key / per-poll logging and debug saves inside the hunt loops
+        self.debug_screenshots = False  # Save the post-beforeMenu battle check frame for offline comparison
+        self._rebuild_sequences()
+        
+        # Probe configuration
+        self._min_probe_interval = 0.08  # Minimum time between two screen grabs
+        self._last_probe_time = 0.0
+        self._probe_lock = threading.Lock()  # Serializes probes on the detect cache and the engine's aHash gate state
+        self._detect_cache = {}  # Coarse-frame hash -> (battle menu, beforeMenu), cleared every movement cycle
+        self.detect_cache_size = 64
+        
+        # Background detector (runs with the hunt thread, probes only during movement cycles)
+        # Capture+match rate of the detector thread. Results are only read once per move, from a frame
+        # grabbed after the key release, so at 4 Hz that check waits at most ~250 ms for its frame
+        self.detector_hz = 4.0
+        self._detector_thread = None
+        self._detector_stop = threading.Event()
+        self._detector_active = threading.Event()  # Set while a movement cycle wants detections
+        self._detection_cond = threading.Condition()
+        self._latest_detection = None  # (time.monotonic() of the grab, battle menu, beforeMenu, screenshot)
+        self._battle_frame = None  # Frame that confirmed the battle, handed to perform_battle_sequence
+        self._op_deadline = 0.0  # time.monotonic() the battle key schedule has reached, see _sleep_on_schedule
         
         # Healing configuration
         self.heal_key = 'q'  # Default to Q key for teleport/heal
@@ -72,23 +106,44 @@ class PPAutoHuntEngine:
         
         # Preset management
         self.presets_dir = "auto_hunt_presets"
+        self._preset_cache = (None, [])  # (directory st_mtime_ns, sorted preset names)
+        self._preset_content_cache = {}  # Preset name -> (file st_mtime_ns, parsed config)
         self.ensure_presets_directory()
         
-    def interruptible_sleep(self, duration: float, check_interval: float = 0.1) -> bool:
-        """Sleep for duration but check stop flag every check_interval seconds
+    def _configure_opencv_threads(self):
+        """Keep OpenCV's SIMD paths on and its thread pool small so matching doesn't contend with the game"""
+        try:
+            cv2.setUseOptimized(True)
+            game_rect = self.window_manager.game_rect
+            threads = max(1, min(self.cv_threads, os.cpu_count() or 1))
+            if game_rect:
+                left, top, right, bottom = game_rect
+                fx1, fy1, fx2, fy2 = self.auto_hunt_engine.battle_menu_roi
+                roi_pixels = (right - left) * (fx2 - fx1) * (bottom - top) * (fy2 - fy1)
+                if roi_pixels < self.small_roi_pixels:
+                    threads = 1
+            cv2.setNumThreads(threads)
+        except Exception as e:
+            print(f"⚠️ Could not configure OpenCV threads: {e}")
+    
+    def interruptible_sleep(self, duration: float) -> bool:
+        """Sleep for duration, waking as soon as the hunt is stopped or paused
         Returns True if completed normally, False if interrupted by stop flag"""
         if duration <= 0:
             return True
-            
-        elapsed = 0.0
-        while elapsed < duration:
-            if self.stop_flag or self.is_paused:
-                return False
-            
-            sleep_time = min(check_interval, duration - elapsed)
-            time.sleep(sleep_time)
-            elapsed += sleep_time
+        if duration <= self.short_sleep_max:
+            return self._short_sleep(duration)
+        if self.stop_flag or self.is_paused:
+            return False
         
+        self._interrupt_event.wait(duration)
+        return not (self.stop_flag or self.is_paused)
+    
+    def _short_sleep(self, duration: float) -> bool:
+        """Plain sleep for key holds and tap gaps - too short to be worth waking early"""
+        if self.stop_flag or self.is_paused:
+            return False
+        time.sleep(duration)
         return True
     
     def set_movement_macro(self, macro_name: str) -> bool:
@@ -97,12 +152,10 @@ class PPAutoHuntEngine:
             self.selected_macro = None
             return False
         
-        if self.macro_manager.get_macro_list():
-            for macro in self.macro_manager.get_macro_list():
-                if macro['name'] == macro_name:
-                    self.selected_macro = macro_name
-                    print(f"✓ Selected movement macro: {macro_name}")
-                    return True
+        if macro_name in self.macro_manager.get_macro_index():
+            self.selected_macro = macro_name
+            print(f"✓ Selected movement macro: {macro_name}")
+            return True
         
         print(f"❌ Macro '{macro_name}' not found")
         return False
@@ -113,7 +166,7 @@ class PPAutoHuntEngine:
     
     def macro_exists(self, macro_name: str) -> bool:
         """Check if a macro exists"""
-        return any(macro['name'] == macro_name for macro in self.get_available_macros())
+        return macro_name in self.macro_manager.get_macro_index()
     
     def execute_movement_macro(self):
         """Execute the selected movement macro"""
@@ -131,17 +184,13 @@ class PPAutoHuntEngine:
         # Load and play the macro
         try:
             # Find the full filepath for the selected macro
-            macro_filepath = None
-            available_macros = self.get_available_macros()
-            
-            for macro in available_macros:
-                if macro['name'] == self.selected_macro:
-                    macro_filepath = macro['filepath']
-                    break
+            macro_index = self.macro_manager.get_macro_index()
+            macro = macro_index.get(self.selected_macro)
+            macro_filepath = macro['filepath'] if macro else None
             
             if not macro_filepath:
                 print(f"❌ Macro not found: {self.selected_macro}")
-                print(f"🔍 Available macros: {[m['name'] for m in available_macros] if available_macros else 'None'}")
+                print(f"🔍 Available macros: {list(macro_index) if macro_index else 'None'}")
                 return False
             
             print(f"📂 Loading macro from: {macro_filepath}")
@@ -184,6 +233,48 @@ class PPAutoHuntEngine:
             print(f"❌ Error executing movement macro: {e}")
             return False
     
+    def _grab_np(self) -> Optional[np.ndarray]:
+        """Capture the game window as a BGR array (mss when available, else the engine's full capture)
+        
+        Always a fresh array: the detector thread publishes it and the OCR queue holds it by reference,
+        so unlike the hunt loop's ROI probe it must not come from a reused capture buffer.
+        """
+        # Read the rect on every grab so a moved or resized window is followed immediately
+        game_rect = self.window_manager.game_rect
+        # Cap the grab rate so captures right after a key release don't repeat the previous probe
+        wait = self._last_probe_time + self._min_probe_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_probe_time = time.monotonic()
+        if not MSS_AVAILABLE or not game_rect:
+            return self.auto_hunt_engine.capture_full_game_screen()
+        return self.auto_hunt_engine.capture_game_region(game_rect)
+    
+    def _probe_levels(self, screenshot: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Grayscale frame and its coarse pyramid level, computed once and shared by every template check"""
+        gray = self.auto_hunt_engine._to_gray(screenshot)
+        # Downscale from the 8-bit conversion _to_gray keeps alongside the float frame
+        return gray, self.auto_hunt_engine._coarse_level(self.auto_hunt_engine._screen_u8)
+    
+    def detect_battle_menu_roi(self, screenshot: np.ndarray, gray: Optional[np.ndarray] = None,
+                               small: Optional[np.ndarray] = None) -> bool:
+        """Battle menu check on the engine's battle-menu ROI only
+        Every loaded template is checked, like detect_battle_menu, so user-added menu templates count"""
+        height, width = screenshot.shape[:2]
+        fx1, fy1, fx2, fy2 = self.auto_hunt_engine.battle_menu_roi
+        rows = slice(int(height * fy1), int(height * fy2))
+        cols = slice(int(width * fx1), int(width * fx2))
+        roi = screenshot[rows, cols]
+        gray_roi = gray[rows, cols] if gray is not None else self.auto_hunt_engine._to_gray(roi)
+        small_roi = None
+        if small is not None:
+            # Same fractions on the coarse level; the pyramid's confirm padding absorbs the rounding
+            small_h, small_w = small.shape[:2]
+            small_roi = small[int(small_h * fy1):int(small_h * fy2), int(small_w * fx1):int(small_w * fx2)]
+        
+        return self.auto_hunt_engine.detect_battle_menu_fast(roi, gray_roi, small_roi,
+                                                             list(self.auto_hunt_engine.templates))
+    
     def press_key_with_delay(self, key: str, duration: float = 0.1):
         """Press and release a key with specified duration"""
         self.input_manager.press_key(key)
@@ -211,134 +302,224 @@ class PPAutoHuntEngine:
         
         movement_index = 0
         cycle_count = 0
-        last_ocr_time = 0
         
-        while not self.stop_flag and not self.is_paused and self.is_hunting:
-            # Check for beforeMenu template first and perform OCR analysis
-            screenshot = self.auto_hunt_engine.capture_full_game_screen()
-            if screenshot is not None:
+        # The detector thread captures and matches while keys are held; this loop only reads its results
+        self._battle_frame = None
+        self._detect_cache.clear()  # Templates or thresholds may have changed since the last cycle
+        self._detector_active.set()
+        try:
+            # One-shot check before the first move; afterwards every move ends with its own check
+            battle = self._check_detection(time.monotonic(), False, cycle_count)
+            if battle is not None:
+                return battle
+            
+            while not self.stop_flag and not self.is_paused and self.is_hunting:
+                # Press and hold current movement key for specified duration
+                current_key = self.movement_keys[movement_index]
                 
-                # Perform OCR analysis based on frequency setting (reduced logging)
-                current_time = time.time()
-                if current_time - last_ocr_time >= self.auto_hunt_engine.ocr_screenshot_interval:
-                    # Run Pokemon name detection to check for special encounters (quick check, 2 retries max)
-                    pokemon_names, is_horde, contains_shiny = self.auto_hunt_engine.detect_pokemon_names_top_screen(screenshot, max_retries=2)
-                    
-                    if pokemon_names and (contains_shiny or is_horde):
-                        print(f"🌟 Special encounter detected during movement! Shiny: {contains_shiny}, Horde: {is_horde}")
-                        # Don't stop movement here - let the battle detection handle it properly
-                    
-                    last_ocr_time = current_time
-                # Check for beforeMenu template
-                beforemenu_detected, _ = self.auto_hunt_engine.detect_template(screenshot, "beforeMenu")
-                if beforemenu_detected:
-                    print("🎬 Pre-battle screen detected! Waiting 2 seconds before checking for battle menu...")
-                    if not self.interruptible_sleep(2.0):
-                        return False
-                    
-                    # Now check for actual battle menu
-                    screenshot = self.auto_hunt_engine.capture_full_game_screen()
-                    if screenshot is not None:
-                        # Save debug screenshot during hunt for comparison with test button
-                        self.auto_hunt_engine.save_debug_screenshot(screenshot, "pp_hunt_battle_check")
-                        print("🔍 PP Hunt: Saved debug screenshot for battle menu analysis")
-                        
-                        if self.auto_hunt_engine.detect_battle_menu(screenshot):
-                            print("⚔️ Battle menu confirmed after beforeMenu detection!")
-                            return True
-                        else:
-                            print("⚠️ No battle menu found after beforeMenu - continuing movement")
-                            print(f"🔍 PP Hunt: Templates loaded: {len(self.auto_hunt_engine.templates)}")
-                            if self.auto_hunt_engine.templates:
-                                print(f"🔍 PP Hunt: Available templates: {list(self.auto_hunt_engine.templates.keys())}")
-                    else:
-                        print("❌ PP Hunt: Could not capture screenshot after beforeMenu")
+                # Press key
+                self.input_manager.press_key(current_key)
                 
-                # Regular battle menu detection (fallback)
-                # Save debug screenshot for regular detection too
-                self.auto_hunt_engine.save_debug_screenshot(screenshot, "pp_hunt_regular_check")
+                # Hold for specified duration with interruptible sleep
+                if not self.interruptible_sleep(self.key_hold_duration):
+                    # Release key if interrupted
+                    self.input_manager.release_key(current_key)
+                    return False
                 
-                if self.auto_hunt_engine.detect_battle_menu(screenshot):
-                    print("⚔️ Battle menu detected directly! Stopping movement")
-                    return True
-                else:
-                    # Every 20 cycles, provide detailed debug info
-                    if cycle_count % 20 == 0:
-                        print(f"🔍 PP Hunt Debug (cycle {cycle_count}):")
-                        print(f"   Screenshot captured: {screenshot.shape if screenshot is not None else 'None'}")
-                        print(f"   Templates loaded: {len(self.auto_hunt_engine.templates)}")
-                        if self.auto_hunt_engine.templates:
-                            print(f"   Template names: {list(self.auto_hunt_engine.templates.keys())}")
-                        else:
-                            print("   ⚠️ No templates loaded! This might be the issue.")
-            else:
-                print("❌ PP Hunt: Could not capture screenshot during movement cycle")
-            
-            # Press and hold current movement key for specified duration
-            current_key = self.movement_keys[movement_index]
-            
-            # Press key
-            self.input_manager.press_key(current_key)
-            
-            # Hold for specified duration with interruptible sleep
-            if not self.interruptible_sleep(self.key_hold_duration):
-                # Release key if interrupted
+                # Release key
                 self.input_manager.release_key(current_key)
-                return False
+                released_at = time.monotonic()
+                
+                # Check for beforeMenu and battle menu on a frame grabbed after the release
+                battle = self._check_detection(released_at, True, cycle_count)
+                if battle is not None:
+                    return battle
+                
+                # Wait between key presses
+                if not self.interruptible_sleep(self.movement_interval):
+                    return False
+                
+                # Alternate between A and D
+                movement_index = (movement_index + 1) % len(self.movement_keys)
+                cycle_count += 1
+                
+                # Add some status output every 10 cycles (reduced frequency since keys hold longer)
+                if cycle_count % 10 == 0:
+                    print(f"🔄 Movement cycle {cycle_count} - still searching for battle...")
             
-            # Release key
-            self.input_manager.release_key(current_key)
+            return False
+        finally:
+            # Stop probing and let an in-flight probe finish before the battle phase uses the engine
+            self._detector_active.clear()
+            with self._probe_lock:
+                pass
+    
+    def _probe_frame(self, screenshot: np.ndarray) -> Tuple[bool, bool]:
+        """Check one frame for (battle menu, beforeMenu) - caller holds _probe_lock"""
+        # One grayscale conversion and coarse level per frame, shared by the beforeMenu and battle menu checks
+        gray, small = self._probe_levels(screenshot)
+        # Holding A/D into the same spots repeats frames. Keyed on a hash of the coarse level - a heuristic:
+        # frames that differ only below 1/4 scale share a key, which at worst delays detection by one poll
+        signature = self.auto_hunt_engine._hash_region(small)
+        cached = self._detect_cache.get(signature)
+        if cached is not None:
+            return cached
+        
+        beforemenu_detected, _ = self.auto_hunt_engine.detect_template(screenshot, "beforeMenu", gray, small)
+        if beforemenu_detected:
+            # _check_detection waits and re-probes before trusting the battle menu, so this frame's is unused
+            result = (False, True)
+        else:
+            result = (self.detect_battle_menu_roi(screenshot, gray, small), False)
+        
+        if len(self._detect_cache) >= self.detect_cache_size:
+            del self._detect_cache[next(iter(self._detect_cache))]  # Drop the oldest entry
+        self._detect_cache[signature] = result
+        return result
+    
+    def _detector_loop(self):
+        """Capture and match at detector_hz while a movement cycle is active, publishing the latest result"""
+        last_ocr_time = 0.0
+        while not self._detector_stop.is_set():
+            if not self._detector_active.wait(0.2):
+                continue
             
-            # Check for beforeMenu and battle menu after movement
-            screenshot = self.auto_hunt_engine.capture_full_game_screen()
+            started = time.monotonic()
+            screenshot = self._grab_np()
             if screenshot is not None:
-                # Check for beforeMenu template
-                beforemenu_detected, _ = self.auto_hunt_engine.detect_template(screenshot, "beforeMenu")
-                if beforemenu_detected:
-                    print("🎬 Pre-battle screen detected after movement! Waiting 2 seconds...")
-                    if not self.interruptible_sleep(2.0):
-                        return False
-                    
-                    # Now check for actual battle menu
-                    screenshot = self.auto_hunt_engine.capture_full_game_screen()
-                    if screenshot is not None:
-                        # Save debug screenshot for post-movement analysis
-                        self.auto_hunt_engine.save_debug_screenshot(screenshot, "pp_hunt_post_movement")
-                        print("🔍 PP Hunt: Saved post-movement debug screenshot")
-                        
-                        if self.auto_hunt_engine.detect_battle_menu(screenshot):
-                            print("⚔️ Battle menu confirmed after post-movement beforeMenu detection!")
-                            return True
-                        else:
-                            print("⚠️ No battle menu found after post-movement beforeMenu - continuing")
-                    else:
-                        print("❌ PP Hunt: Could not capture screenshot after post-movement beforeMenu")
+                # Pokemon name check for special encounters runs on the engine's batched OCR worker
+                if started - last_ocr_time >= self.auto_hunt_engine.ocr_screenshot_interval:
+                    self.auto_hunt_engine.submit_ocr_frame(screenshot, self._on_movement_ocr_result)
+                    last_ocr_time = started
+                
+                with self._probe_lock:
+                    if not self._detector_active.is_set():
+                        continue
+                    try:
+                        battle, beforemenu = self._probe_frame(screenshot)
+                    except Exception as e:
+                        print(f"❌ PP Hunt: Detector error: {e}")
+                        battle = beforemenu = False
                 
-                # Regular battle menu detection (fallback)
-                if self.auto_hunt_engine.detect_battle_menu(screenshot):
-                    print("⚔️ Battle menu detected after movement! Stopping")
-                    return True
+                with self._detection_cond:
+                    self._latest_detection = (started, battle, beforemenu, screenshot)
+                    self._detection_cond.notify_all()
             
-            # Wait between key presses
-            if not self.interruptible_sleep(self.movement_interval):
+            self._detector_stop.wait(max(0.0, 1.0 / self.detector_hz - (time.monotonic() - started)))
+    
+    def _start_detector(self):
+        """Start the background detector thread"""
+        if self._detector_thread and self._detector_thread.is_alive():
+            return
+        self._detector_stop.clear()
+        self._latest_detection = None
+        self._detector_thread = threading.Thread(target=self._detector_loop, daemon=True)
+        self._detector_thread.start()
+    
+    def _stop_detector(self):
+        """Stop the background detector thread"""
+        self._detector_stop.set()
+        self._detector_active.clear()
+        if self._detector_thread and threading.current_thread() != self._detector_thread:
+            self._detector_thread.join(timeout=1.0)
+        self._detector_thread = None
+    
+    def _wait_for_detection(self, since: float, timeout: float = 1.0):
+        """Latest detector result grabbed at or after since (monotonic), or None if none arrives in time"""
+        if not (self._detector_thread and self._detector_thread.is_alive()):
+            # No detector running (e.g. called outside the hunt loop) - probe inline
+            screenshot = self._grab_np()
+            if screenshot is None:
+                return None
+            with self._probe_lock:
+                battle, beforemenu = self._probe_frame(screenshot)
+            return time.monotonic(), battle, beforemenu, screenshot
+        
+        deadline = time.monotonic() + timeout
+        with self._detection_cond:
+            while self._latest_detection is None or self._latest_detection[0] < since:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self.stop_flag:
+                    return None
+                self._detection_cond.wait(remaining)
+            return self._latest_detection
+    
+    def _check_detection(self, since: float, after_move: bool, cycle_count: int) -> Optional[bool]:
+        """Act on the detector's result for the current move
+        Returns True when a battle is confirmed, False if interrupted, None to keep moving"""
+        where = " after movement" if after_move else ""
+        
+        detection = self._wait_for_detection(since)
+        if detection is None:
+            print("❌ PP Hunt: Could not capture screenshot during movement cycle")
+            return None
+        _, battle, beforemenu_detected, screenshot = detection
+        
+        if beforemenu_detected:
+            print(f"🎬 Pre-battle screen detected{where}! Waiting 2 seconds before checking for battle menu...")
+            if not self.interruptible_sleep(2.0):
                 return False
             
-            # Alternate between A and D
-            movement_index = (movement_index + 1) % len(self.movement_keys)
-            cycle_count += 1
+            # Now check for actual battle menu
+            detection = self._wait_for_detection(time.monotonic())
+            if detection is None:
+                print("❌ PP Hunt: Could not capture screenshot after beforeMenu")
+                return None
+            _, battle, _, screenshot = detection
             
-            # Add some status output every 10 cycles (reduced frequency since keys hold longer)
-            if cycle_count % 10 == 0:
-                print(f"🔄 Movement cycle {cycle_count} - still searching for battle...")
+            # Save debug screenshot during hunt for comparison with test button (opt-in)
+            if self.debug_screenshots:
+                self.auto_hunt_engine.save_debug_screenshot(
+                    screenshot, "pp_hunt_post_movement" if after_move else "pp_hunt_battle_check")
+                print("🔍 PP Hunt: Saved debug screenshot for battle menu analysis")
+            
+            if battle:
+                print(f"⚔️ Battle menu confirmed after{where} beforeMenu detection!")
+                self._battle_frame = screenshot
+                return True
+            
+            print(f"⚠️ No battle menu found after{where} beforeMenu - continuing movement")
+            print(f"🔍 PP Hunt: Templates loaded: {len(self.auto_hunt_engine.templates)}")
+            if self.auto_hunt_engine.templates:
+                print(f"🔍 PP Hunt: Available templates: {list(self.auto_hunt_engine.templates.keys())}")
+            return None
+        
+        # Regular battle menu detection (fallback)
+        # Save debug screenshot for regular detection too (every poll, so verbose only)
+        if self.verbose:
+            self.auto_hunt_engine.save_debug_screenshot(screenshot, "pp_hunt_regular_check")
+        
+        if battle:
+            print(f"⚔️ Battle menu detected{where}! Stopping movement")
+            self._battle_frame = screenshot
+            return True
         
-        return False
+        # Every 20 cycles, provide detailed debug info
+        if self.verbose and cycle_count % 20 == 0:
+            print(f"🔍 PP Hunt Debug (cycle {cycle_count}):")
+            print(f"   Screenshot captured: {screenshot.shape}")
+            print(f"   Templates loaded: {len(self.auto_hunt_engine.templates)}")
+            if self.auto_hunt_engine.templates:
+                print(f"   Template names: {list(self.auto_hunt_engine.templates.keys())}")
+            else:
+                print("   ⚠️ No templates loaded! This might be the issue.")
+        return None
+    
+    def _on_movement_ocr_result(self, pokemon_names, is_horde, contains_shiny):
+        """Report a special encounter spotted by the background name OCR during movement"""
+        if pokemon_names and (contains_shiny or is_horde):
+            print(f"🌟 Special encounter detected during movement! Shiny: {contains_shiny}, Horde: {is_horde}")
+            # Don't stop movement here - let the battle detection handle it properly
     
     def perform_battle_sequence(self) -> bool:
         """Perform Sweet Scent-style battle sequence with initial E presses + loop"""
         print("⚔️ Starting battle sequence with Pokemon analysis")
         
         # First, analyze the encounter for Pokemon names and special detection
-        screenshot = self.auto_hunt_engine.capture_full_game_screen()
+        # (on the frame that confirmed the battle when there is one, instead of grabbing again)
+        screenshot, self._battle_frame = self._battle_frame, None
+        if screenshot is None:
+            screenshot = self._grab_np()
         if screenshot is not None:
             should_continue, encounter_type = self.auto_hunt_engine.analyze_encounter_for_pokemon(screenshot)
             
@@ -373,12 +554,15 @@ class PPAutoHuntEngine:
             if self.stop_flag or self.is_paused or not self.is_hunting:
                 return False
             
-            print(f"🎮 Pressing E key ({i+1}/{self.initial_e_presses})")
-            self.press_key_with_delay('e', 0.1)
+            if self.verbose:
+                print(f"🎮 Pressing E key ({i+1}/{self.initial_e_presses})")
+            if i == 0:
+                self._op_deadline = time.monotonic()
+            self._press_on_schedule('e', 0.1)
             
             # Wait between E presses (except after the last one)
             if i < self.initial_e_presses - 1:
-                if not self.interruptible_sleep(self.battle_key_interval):
+                if not self._sleep_on_schedule(self.battle_key_interval):
                     return False
         
         # Phase 2: Post-E delay
@@ -389,48 +573,30 @@ class PPAutoHuntEngine:
         
         # Phase 3: Encounter loop (E+E or X+E)
         print(f"🔄 Starting {self.encounter_loop_type.upper()} encounter loop for {self.encounter_loop_duration}s")
-        loop_start_time = time.time()
+        loop_deadline = time.monotonic() + self.encounter_loop_duration
         loop_cycles = 0
+        self._op_deadline = time.monotonic()
         
         while not self.stop_flag and not self.is_paused and self.is_hunting:
-            elapsed_time = time.time() - loop_start_time
-            remaining_time = self.encounter_loop_duration - elapsed_time
-            
+            remaining_time = loop_deadline - time.monotonic()
             if remaining_time <= 0:
                 break
             
             # Check if battle menu is gone
-            screenshot = self.auto_hunt_engine.capture_full_game_screen()
-            if screenshot is None or not self.auto_hunt_engine.detect_battle_menu(screenshot):
+            screenshot = self._grab_np()
+            if screenshot is not None:
+                with self._probe_lock:
+                    battle_menu = self.detect_battle_menu_roi(screenshot)
+            if screenshot is None or not battle_menu:
                 print("✅ Battle menu no longer detected during loop - battle complete")
                 break
             
             loop_cycles += 1
             
-            # Execute the encounter loop sequence
-            if self.encounter_loop_type == 'e+e':
-                # E + E sequence
-                print("🎮 Pressing E key")
-                self.press_key_with_delay('e', 0.1)
-                if not self.interruptible_sleep(self.encounter_loop_interval):
+            # Execute the precompiled encounter loop sequence (E+E or X+E, then the gap between combinations)
+            for op, *args in self._loop_ops:
+                if not self._exec_op(op, args):
                     return False
-                
-                print("🎮 Pressing E key")
-                self.press_key_with_delay('e', 0.1)
-                
-            elif self.encounter_loop_type == 'x+e':
-                # X + E sequence
-                print("🎮 Pressing X key")
-                self.press_key_with_delay('x', 0.1)
-                if not self.interruptible_sleep(self.encounter_loop_interval):
-                    return False
-                
-                print("🎮 Pressing E key")
-                self.press_key_with_delay('e', 0.1)
-            
-            # Wait between combinations
-            if not self.interruptible_sleep(self.encounter_loop_interval):
-                return False
             
             # Show progress every 20 cycles
             if loop_cycles % 20 == 0:
@@ -448,6 +614,41 @@ class PPAutoHuntEngine:
         
         return True
     
+    def _rebuild_sequences(self):
+        """Precompile the encounter loop into (op, *args) tuples from the current configuration"""
+        first_key = 'x' if self.encounter_loop_type == 'x+e' else 'e'
+        self._loop_ops = [
+            ('press', first_key, 0.1),
+            ('sleep', self.encounter_loop_interval),
+            ('press', 'e', 0.1),
+            ('sleep', self.encounter_loop_interval),
+        ]
+    
+    def _exec_op(self, op: str, args) -> bool:
+        """Run one precompiled sequence op, returns False if interrupted"""
+        if op == 'press':
+            if self.verbose:
+                print(f"🎮 Pressing {args[0].upper()} key")
+            self._press_on_schedule(*args)
+            return True
+        return self._sleep_on_schedule(*args)
+    
+    def _press_on_schedule(self, key: str, duration: float):
+        """press_key_with_delay that also advances the key schedule by its hold time"""
+        self.press_key_with_delay(key, duration)
+        self._op_deadline += duration
+    
+    def _sleep_on_schedule(self, duration: float) -> bool:
+        """Sleep until duration past the previous scheduled point, so press/probe overhead doesn't stretch the cadence
+        Returns False if interrupted"""
+        now = time.monotonic()
+        self._op_deadline += duration
+        if self._op_deadline <= now:
+            # Running late - resync rather than firing a burst of keys to catch up
+            self._op_deadline = now
+            return not (self.stop_flag or self.is_paused)
+        return self.interruptible_sleep(self._op_deadline - now)
+    
     def perform_heal_sequence(self) -> bool:
         """Perform healing sequence to recover PP"""
         print("💊 Performing heal sequence (PP recovery)")
@@ -472,6 +673,7 @@ class PPAutoHuntEngine:
         """Main auto hunt loop"""
         print("🏹 Starting PP-based auto hunt loop")
         self.hunt_start_time = time.time()
+        self._start_detector()
         
         try:
             while not self.stop_flag and self.is_hunting:
@@ -515,6 +717,8 @@ class PPAutoHuntEngine:
             print(f"❌ Error in hunt loop: {e}")
         
         finally:
+            self._stop_detector()
+            
             # Calculate total time
             if self.hunt_start_time:
                 self.total_hunt_time += time.time() - self.hunt_start_time
@@ -556,10 +760,12 @@ class PPAutoHuntEngine:
         self.stop_flag = False
         self.is_hunting = True
         self.is_paused = False
+        self._interrupt_event.clear()
         self.encounters_found = 0
         self.hunt_cycles = 0
         self.heal_cycles = 0
         self.current_encounters = 0
+        self._configure_opencv_threads()
         
         print(f"🔧 Debug: stop_flag reset to {self.stop_flag}, is_hunting set to {self.is_hunting}")
         
@@ -597,11 +803,13 @@ class PPAutoHuntEngine:
         self.stop_flag = False
         self.is_hunting = True
         self.is_paused = False
+        self._interrupt_event.clear()
         self.encounters_found = 0
         self.hunt_cycles = 0
         self.heal_cycles = 0
         self.current_encounters = 0
         self.started_without_macro = True
+        self._configure_opencv_threads()
         
         print(f"🔧 Debug: stop_flag reset to {self.stop_flag}, is_hunting set to {self.is_hunting}")
         
@@ -620,6 +828,7 @@ class PPAutoHuntEngine:
         print("🛑 Stopping PP Auto Hunt...")
         self.is_hunting = False
         self.stop_flag = True
+        self._interrupt_event.set()
         
         # Wait for thread to finish
         if self.hunt_thread and threading.current_thread() != self.hunt_thread:
@@ -632,6 +841,7 @@ class PPAutoHuntEngine:
         self.is_hunting = False
         self.is_paused = False
         self.stop_flag = False
+        self._interrupt_event.clear()
         self.hunt_thread = None
         
         # Reset input manager stop flag as well
@@ -651,6 +861,7 @@ class PPAutoHuntEngine:
         self.is_hunting = False
         self.is_paused = False
         self.stop_flag = False
+        self._interrupt_event.clear()
         
         # Reset thread
         self.hunt_thread = None
@@ -664,11 +875,14 @@ class PPAutoHuntEngine:
     def pause_hunt(self):
         """Pause the PP-based auto hunt"""
         self.is_paused = True
+        self._interrupt_event.set()
         print("⏸ PP Auto Hunt paused")
     
     def resume_hunt(self):
         """Resume the PP-based auto hunt"""
         self.is_paused = False
+        if not self.stop_flag:
+            self._interrupt_event.clear()
         print("▶️ PP Auto Hunt resumed")
     
     def set_status_callback(self, callback):
@@ -738,6 +952,11 @@ class PPAutoHuntEngine:
             self.auto_hunt_engine.ocr_screenshot_interval = ocr_freq
             print(f"🔍 OCR frequency updated to: {ocr_freq}s")
         
+        if 'cv_threads' in config:
+            self.cv_threads = max(1, min(8, int(config['cv_threads'])))
+            self._configure_opencv_threads()
+        
+        self._rebuild_sequences()
         print("✅ PP Auto Hunt configuration updated")
     
     def ensure_presets_directory(self):
@@ -764,12 +983,21 @@ class PPAutoHuntEngine:
                 'heal_delay': self.heal_delay,
                 'heal_key': self.heal_key,
                 'ocr_frequency': self.auto_hunt_engine.ocr_screenshot_interval,
+                'cv_threads': self.cv_threads,
                 'selected_macro': self.selected_macro
             }
             
             preset_path = os.path.join(self.presets_dir, f"{preset_name}.json")
-            with open(preset_path, 'w') as f:
-                json.dump(preset_config, f, indent=2)
+            # Write a temp file and swap it in, so an interrupted save never leaves a half-written preset
+            temp_path = preset_path + '.tmp'
+            if ORJSON_AVAILABLE:
+                with open(temp_path, 'wb') as f:
+                    f.write(orjson.dumps(preset_config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_path, 'w') as f:
+                    json.dump(preset_config, f, indent=2)
+            os.replace(temp_path, preset_path)
+            self._preset_content_cache.pop(preset_name, None)
             
             print(f"💾 Saved PP Auto Hunt preset '{preset_name}' to {preset_path}")
             return True
@@ -787,8 +1015,15 @@ class PPAutoHuntEngine:
                 print(f"❌ Preset '{preset_name}' not found")
                 return False
             
-            with open(preset_path, 'r') as f:
-                preset_config = json.load(f)
+            # Reparse only when the file changed since it was last loaded
+            mtime = os.stat(preset_path).st_mtime_ns
+            cached = self._preset_content_cache.get(preset_name)
+            if cached and cached[0] == mtime:
+                preset_config = cached[1]
+            else:
+                with open(preset_path, 'r') as f:
+                    preset_config = json.load(f)
+                self._preset_content_cache[preset_name] = (mtime, preset_config)
             
             # Apply the preset configuration
             self.update_configuration(preset_config)
@@ -814,6 +1049,7 @@ class PPAutoHuntEngine:
                 return False
             
             os.remove(preset_path)
+            self._preset_content_cache.pop(preset_name, None)
             print(f"🗑️ Deleted PP Auto Hunt preset '{preset_name}'")
             return True
             
@@ -825,14 +1061,15 @@ class PPAutoHuntEngine:
         """Get list of available presets"""
         try:
             self.ensure_presets_directory()
-            presets = []
+            mtime = os.stat(self.presets_dir).st_mtime_ns
             
-            for filename in os.listdir(self.presets_dir):
-                if filename.endswith('.json'):
-                    preset_name = filename[:-5]  # Remove .json extension
-                    presets.append(preset_name)
+            # Saving/deleting a preset bumps the directory mtime; otherwise reuse the last listing
+            if mtime != self._preset_cache[0]:
+                presets = sorted(entry.name[:-5] for entry in os.scandir(self.presets_dir)  # Remove .json extension
+                                 if entry.name.endswith('.json'))
+                self._preset_cache = (mtime, presets)
             
-            return sorted(presets)
+            return list(self._preset_cache[1])
             
         except Exception as e:
             print(f"❌ Failed to get preset list: {e}")
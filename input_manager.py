@@ -8,8 +8,141 @@ import threading
 import win32api
 import win32con
 import win32gui
+import ctypes
+from ctypes import wintypes
 from config import *
 
+# SendInput structures (user32) - lets several key events go out in a single call
+INPUT_KEYBOARD = 1
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [("uMsg", wintypes.DWORD), ("wParamL", wintypes.WORD), ("wParamH", wintypes.WORD)]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+def _send_input(events) -> int:
+    """Send a list of (vk_code, key_up) pairs with one SendInput call, returns how many were inserted"""
+    count = len(events)
+    if count == 0:
+        return 0
+    inputs = (INPUT * count)()
+    for i, (vk_code, key_up) in enumerate(events):
+        inputs[i].type = INPUT_KEYBOARD
+        inputs[i].ki = KEYBDINPUT(vk_code, 0, win32con.KEYEVENTF_KEYUP if key_up else 0, 0, 0)
+    return ctypes.windll.user32.SendInput(count, inputs, ctypes.sizeof(INPUT))
+
+def send_key_sequence(steps, vk_lookup) -> int:
+    """Tap keys through SendInput; steps are (key, hold_seconds, gap_seconds_after) tuples
+    Returns how many steps were tapped, stopping at the first failure so callers can redo only the rest"""
+    vk_codes = [vk_lookup(key) for key, _, _ in steps]
+    if not all(vk_codes):
+        print(f"❌ Unknown key in sequence: {[key for key, _, _ in steps]}")
+        return 0
+    
+    # Untimed taps are collected and sent together; a hold or a pause ends the current batch
+    plan = []  # ([(vk_code, key_up, step index)], seconds to sleep after sending)
+    batch = []
+    for index, (vk_code, (_, hold, gap)) in enumerate(zip(vk_codes, steps)):
+        if hold > 0:
+            batch.append((vk_code, False, index))
+            plan.append((batch, hold))
+            batch = [(vk_code, True, index)]
+        else:
+            batch.extend(((vk_code, False, index), (vk_code, True, index)))
+        if gap > 0:
+            plan.append((batch, gap))
+            batch = []
+    plan.append((batch, 0.0))
+    
+    completed = 0
+    try:
+        for batch, pause in plan:
+            inserted = _send_input([(vk_code, key_up) for vk_code, key_up, _ in batch])
+            for _, key_up, index in batch[:inserted]:
+                if key_up:
+                    completed = index + 1
+            if inserted < len(batch):
+                vk_code, key_up, index = batch[inserted]
+                if key_up:
+                    # The key went down but its release didn't - release it the old way, the tap happened
+                    win32api.keybd_event(vk_code, 0, win32con.KEYEVENTF_KEYUP, 0)
+                    completed = index + 1
+                return completed
+            if pause > 0:
+                time.sleep(pause)
+    except Exception as e:
+        print(f"❌ Error sending key sequence: {e}")
+    return completed
+
+def set_high_resolution_timer(enabled: bool):
+    """Raise (or restore) the Windows timer resolution to 1ms so short sleeps are accurate"""
+    try:
+        if enabled:
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        else:
+            ctypes.windll.winmm.timeEndPeriod(1)
+    except Exception as e:
+        print(f"Could not change timer resolution: {e}")
+
+# Key name -> Windows virtual key code, built once at import (key events look keys up per event)
+VIRTUAL_KEY_CODES = {
+    # Letters
+    **{chr(i).lower(): ord(chr(i)) for i in range(ord('A'), ord('Z') + 1)},
+    # Numbers
+    **{str(i): ord(str(i)) for i in range(10)},
+    # Function keys
+    'f1': win32con.VK_F1, 'f2': win32con.VK_F2, 'f3': win32con.VK_F3,
+    'f4': win32con.VK_F4, 'f5': win32con.VK_F5, 'f6': win32con.VK_F6,
+    'f7': win32con.VK_F7, 'f8': win32con.VK_F8, 'f9': win32con.VK_F9,
+    'f10': win32con.VK_F10, 'f11': win32con.VK_F11, 'f12': win32con.VK_F12,
+    # Special keys
+    'space': win32con.VK_SPACE,
+    'enter': win32con.VK_RETURN,
+    'esc': win32con.VK_ESCAPE,
+    'escape': win32con.VK_ESCAPE,
+    'tab': win32con.VK_TAB,
+    'shift': win32con.VK_SHIFT,
+    'ctrl': win32con.VK_CONTROL,
+    'control': win32con.VK_CONTROL,
+    'alt': win32con.VK_MENU,
+    'backspace': win32con.VK_BACK,
+    'delete': win32con.VK_DELETE,
+    'insert': win32con.VK_INSERT,
+    'home': win32con.VK_HOME,
+    'end': win32con.VK_END,
+    'page_up': win32con.VK_PRIOR,
+    'page_down': win32con.VK_NEXT,
+    'up': win32con.VK_UP,
+    'down': win32con.VK_DOWN,
+    'left': win32con.VK_LEFT,
+    'right': win32con.VK_RIGHT,
+    # Symbols
+    '`': win32con.VK_OEM_3,
+    '-': win32con.VK_OEM_MINUS,
+    '=': win32con.VK_OEM_PLUS,
+    '[': win32con.VK_OEM_4,
+    ']': win32con.VK_OEM_6,
+    '\\': win32con.VK_OEM_5,
+    ';': win32con.VK_OEM_1,
+    "'": win32con.VK_OEM_7,
+    ',': win32con.VK_OEM_COMMA,
+    '.': win32con.VK_OEM_PERIOD,
+    '/': win32con.VK_OEM_2,
+}
+
 class InputManager:
     def __init__(self, window_manager):
         self.window_manager = window_manager
@@ -315,6 +448,8 @@ class InputManager:
     
     def _playback_loop(self, events, speed, loop_count, callback, timeout):
         """Main playback loop with better error handling"""
+        # 1ms sleep granularity for the event schedule, restored in the finally below
+        set_high_resolution_timer(True)
         try:
             start_time = time.time()
             
@@ -334,16 +469,19 @@ class InputManager:
                 if callback:
                     callback("loop_start", {"loop": loop + 1, "total": loop_count})
                 
-                last_timestamp = 0
                 events_executed = 0
                 events_failed = 0
                 
+                # Each event is due at a fixed offset from the loop start, so sleep overshoot and
+                # execution time don't accumulate across events
+                loop_base = time.perf_counter()
+                
                 for event in events:
                     if self.stop_playback:
                         break
                     
-                    # Calculate delay
-                    delay = (event['timestamp'] - last_timestamp) / speed
+                    # Wait until this event's deadline (late events run immediately)
+                    delay = loop_base + event['timestamp'] / speed - time.perf_counter()
                     if delay > 0:
                         time.sleep(delay)
                     
@@ -360,8 +498,6 @@ class InputManager:
                     except Exception as e:
                         print(f"❌ Event execution error: {e}")
                         events_failed += 1
-                    
-                    last_timestamp = event['timestamp']
                 
                 print(f"✅ Loop {loop + 1} completed: {events_executed} events, {events_failed} failed")
                 
@@ -380,6 +516,7 @@ class InputManager:
             if callback:
                 callback("error", {"error": str(e)})
         finally:
+            set_high_resolution_timer(False)
             self.is_playing = False
             if callback:
                 callback("complete", {"success": not self.stop_playback})
@@ -476,54 +613,18 @@ class InputManager:
             print(f"❌ Key event failed: {e}")
             return False
 
+    def press_sequence(self, keys, hold_ms: int = 100, gap_ms: int = 500) -> int:
+        """Tap each key in order through SendInput, holding hold_ms and pausing gap_ms between taps
+        Returns how many taps were sent"""
+        return self.send_sequence([(key, hold_ms / 1000.0, gap_ms / 1000.0) for key in keys])
+    
+    def send_sequence(self, steps) -> int:
+        """Tap keys through SendInput (see send_key_sequence), returns how many steps were sent"""
+        return send_key_sequence(steps, self._get_virtual_key_code)
+
     def _get_virtual_key_code(self, key_name):
         """Get virtual key code from key name"""
-        key_map = {
-            # Letters
-            **{chr(i).lower(): ord(chr(i)) for i in range(ord('A'), ord('Z') + 1)},
-            # Numbers
-            **{str(i): ord(str(i)) for i in range(10)},
-            # Function keys
-            'f1': win32con.VK_F1, 'f2': win32con.VK_F2, 'f3': win32con.VK_F3,
-            'f4': win32con.VK_F4, 'f5': win32con.VK_F5, 'f6': win32con.VK_F6,
-            'f7': win32con.VK_F7, 'f8': win32con.VK_F8, 'f9': win32con.VK_F9,
-            'f10': win32con.VK_F10, 'f11': win32con.VK_F11, 'f12': win32con.VK_F12,
-            # Special keys
-            'space': win32con.VK_SPACE,
-            'enter': win32con.VK_RETURN,
-            'esc': win32con.VK_ESCAPE,
-            'escape': win32con.VK_ESCAPE,
-            'tab': win32con.VK_TAB,
-            'shift': win32con.VK_SHIFT,
-            'ctrl': win32con.VK_CONTROL,
-            'control': win32con.VK_CONTROL,
-            'alt': win32con.VK_MENU,
-            'backspace': win32con.VK_BACK,
-            'delete': win32con.VK_DELETE,
-            'insert': win32con.VK_INSERT,
-            'home': win32con.VK_HOME,
-            'end': win32con.VK_END,
-            'page_up': win32con.VK_PRIOR,
-            'page_down': win32con.VK_NEXT,
-            'up': win32con.VK_UP,
-            'down': win32con.VK_DOWN,
-            'left': win32con.VK_LEFT,
-            'right': win32con.VK_RIGHT,
-            # Symbols
-            '`': win32con.VK_OEM_3,
-            '-': win32con.VK_OEM_MINUS,
-            '=': win32con.VK_OEM_PLUS,
-            '[': win32con.VK_OEM_4,
-            ']': win32con.VK_OEM_6,
-            '\\': win32con.VK_OEM_5,
-            ';': win32con.VK_OEM_1,
-            "'": win32con.VK_OEM_7,
-            ',': win32con.VK_OEM_COMMA,
-            '.': win32con.VK_OEM_PERIOD,
-            '/': win32con.VK_OEM_2,
-        }
-        
-        return key_map.get(key_name.lower())
+        return VIRTUAL_KEY_CODES.get(key_name.lower())
     
     def _center_mouse_in_game(self):
         """Move mouse to center of game window"""
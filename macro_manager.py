@@ -10,6 +10,8 @@ from config import MACROS_DIR, MACRO_CATEGORIES
 class MacroManager:
     def __init__(self):
         self.macros_dir = MACROS_DIR
+        self._macro_index = {}  # Macro name -> macro info, see get_macro_index
+        self._macro_index_stamp = None  # (path, st_mtime_ns) of every macro file the index was built from
         self.ensure_directories()
         
     def ensure_directories(self):
@@ -90,6 +92,25 @@ class MacroManager:
         
         return macros
     
+    def get_macro_index(self):
+        """Name -> macro info for every macro, rebuilt only when a macro file is added, removed or rewritten"""
+        # Stat-only scan of the category folders; get_macro_list parses every file, so it runs only on changes
+        stamp = []
+        try:
+            for category in os.scandir(self.macros_dir):
+                if category.is_dir():
+                    stamp.extend((entry.path, entry.stat().st_mtime_ns) for entry in os.scandir(category.path)
+                                 if entry.name.endswith('.json'))
+        except OSError:
+            stamp = None
+        
+        if stamp is None or stamp != self._macro_index_stamp:
+            self._macro_index = {}
+            for macro in self.get_macro_list():
+                self._macro_index.setdefault(macro['name'], macro)  # First match wins
+            self._macro_index_stamp = stamp
+        return self._macro_index
+    
     def get_macros(self, category=None):
         """Alias for get_macro_list for compatibility"""
         macro_list = self.get_macro_list(category)
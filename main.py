@@ -7,16 +7,34 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
+import queue
 import win32api
 import win32con
 import win32gui
 from config import *
 from window_manager import WindowManager
+from input_manager import send_key_sequence, set_high_resolution_timer
 from macro_manager import MacroManager
 from auto_hunt import AutoHuntEngine, TemplateManager
 from sweet_scent import SweetScentEngine
 from auto_hunt_pp import PPAutoHuntEngine
 
+# Named keys used by recording and playback, built once at import (looked up on every key event)
+KEY_NAME_VK_CODES = {
+    'space': win32con.VK_SPACE,
+    'enter': win32con.VK_RETURN,
+    'tab': win32con.VK_TAB,
+    'esc': win32con.VK_ESCAPE,
+    'shift': win32con.VK_SHIFT,
+    'ctrl': win32con.VK_CONTROL,
+    'alt': win32con.VK_MENU,
+    'up': win32con.VK_UP,
+    'down': win32con.VK_DOWN,
+    'left': win32con.VK_LEFT,
+    'right': win32con.VK_RIGHT,
+}
+VK_KEY_NAMES = {vk_code: name for name, vk_code in KEY_NAME_VK_CODES.items()}
+
 class InputCapturePolling:
     """Polling-based input capture - more compatible than pynput"""
     
@@ -212,22 +230,8 @@ class InputCapturePolling:
     
     def _vk_to_key_name(self, vk_code):
         """Convert virtual key code to readable key name"""
-        key_map = {
-            win32con.VK_SPACE: 'space',
-            win32con.VK_RETURN: 'enter',
-            win32con.VK_TAB: 'tab',
-            win32con.VK_ESCAPE: 'esc',
-            win32con.VK_SHIFT: 'shift',
-            win32con.VK_CONTROL: 'ctrl',
-            win32con.VK_MENU: 'alt',
-            win32con.VK_UP: 'up',
-            win32con.VK_DOWN: 'down',
-            win32con.VK_LEFT: 'left',
-            win32con.VK_RIGHT: 'right',
-        }
-        
-        if vk_code in key_map:
-            return key_map[vk_code]
+        if vk_code in VK_KEY_NAMES:
+            return VK_KEY_NAMES[vk_code]
         elif ord('0') <= vk_code <= ord('9'):
             return chr(vk_code)
         elif ord('A') <= vk_code <= ord('Z'):
@@ -255,6 +259,8 @@ class InputCapturePolling:
     
     def _playback_loop(self, events, speed, loop_count, callback, timeout=120):
         """Playback loop with improved error handling and timeout"""
+        # 1ms sleep granularity for the event schedule, restored in the finally below
+        set_high_resolution_timer(True)
         try:
             self.stop_playback = False
             loop = 0
@@ -274,20 +280,21 @@ class InputCapturePolling:
                 if loop_count != -1 and loop >= loop_count:
                     break
                 
-                last_timestamp = 0
+                # Each event is due at a fixed offset from the loop start, so sleep overshoot and
+                # execution time don't accumulate across events
+                loop_base = time.perf_counter()
                 
                 for event in events:
                     if self.stop_playback:
                         break
                         
-                    # Wait for correct timing
-                    wait_time = (event['timestamp'] - last_timestamp) / speed
-                    if wait_time > 0:
-                        time.sleep(wait_time)
+                    # Wait until this event's deadline (late events run immediately)
+                    delay = loop_base + event['timestamp'] / speed - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
                     
                     # Execute event (errors are handled gracefully)
                     self._execute_event(event)
-                    last_timestamp = event['timestamp']
                 
                 loop += 1
                 
@@ -302,6 +309,7 @@ class InputCapturePolling:
                 callback('error', str(e))
         
         finally:
+            set_high_resolution_timer(False)
             self.stop_playback = False
             if callback:
                 callback('complete', None)
@@ -368,28 +376,10 @@ class InputCapturePolling:
     
     def _get_virtual_key_code(self, key_name):
         """Get Windows virtual key code from key name"""
-        key_map = {
-            'space': win32con.VK_SPACE,
-            'enter': win32con.VK_RETURN,
-            'tab': win32con.VK_TAB,
-            'esc': win32con.VK_ESCAPE,
-            'shift': win32con.VK_SHIFT,
-            'ctrl': win32con.VK_CONTROL,
-            'alt': win32con.VK_MENU,
-            'up': win32con.VK_UP,
-            'down': win32con.VK_DOWN,
-            'left': win32con.VK_LEFT,
-            'right': win32con.VK_RIGHT,
-            'w': ord('W'),
-            'a': ord('A'),
-            's': ord('S'),
-            'd': ord('D'),
-        }
-        
         if len(key_name) == 1:
             return ord(key_name.upper())
         
-        return key_map.get(key_name.lower())
+        return KEY_NAME_VK_CODES.get(key_name.lower())
     
     def press_key(self, key_name: str):
         """Press a key (for Auto Hunt system)"""
@@ -415,6 +405,15 @@ class InputCapturePolling:
         except Exception as e:
             print(f"❌ Error releasing key {key_name}: {e}")
     
+    def press_sequence(self, keys, hold_ms: int = 100, gap_ms: int = 500) -> int:
+        """Tap each key in order through SendInput, holding hold_ms and pausing gap_ms between taps
+        Returns how many taps were sent"""
+        return self.send_sequence([(key, hold_ms / 1000.0, gap_ms / 1000.0) for key in keys])
+    
+    def send_sequence(self, steps) -> int:
+        """Tap keys through SendInput (see input_manager.send_key_sequence), returns how many steps were sent"""
+        return send_key_sequence(steps, self._get_virtual_key_code)
+    
     def click_at_game_coords(self, x: int, y: int):
         """Click at game coordinates (for Auto Hunt system)"""
         try:
@@ -467,6 +466,7 @@ class PokeMMOOverlay:
         
         # Start periodic updates
         self.update_status()
+        self.poll_encounter_popups()
         
         print("All components initialized successfully!")
     
@@ -1092,6 +1092,38 @@ class PokeMMOOverlay:
                 font=('Segoe UI', 7), 
                 fg='#95a5a6', bg='#2a2a2a').pack(anchor=tk.W, padx=20)
         
+        # Debug checkbox for stage latency metrics
+        self.debug_metrics_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(debug_frame, 
+                      text="📊 Log Detection Latency Metrics", 
+                      variable=self.debug_metrics_var,
+                      command=self.update_debug_metrics_config,
+                      font=('Segoe UI', 9),
+                      fg='#ffffff', bg='#2a2a2a',
+                      activeforeground='#ffffff', activebackground='#2a2a2a',
+                      selectcolor='#34495e').pack(anchor=tk.W, pady=2)
+        
+        tk.Label(debug_frame, 
+                text="💡 Prints P50/P99 timings of each detection stage to the console every few seconds", 
+                font=('Segoe UI', 7), 
+                fg='#95a5a6', bg='#2a2a2a').pack(anchor=tk.W, padx=20)
+        
+        # Debug checkbox for per-poll logging in every hunt mode
+        self.verbose_logging_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(debug_frame, 
+                      text="📝 Verbose Hunt Logging", 
+                      variable=self.verbose_logging_var,
+                      command=self.update_verbose_logging_config,
+                      font=('Segoe UI', 9),
+                      fg='#ffffff', bg='#2a2a2a',
+                      activeforeground='#ffffff', activebackground='#2a2a2a',
+                      selectcolor='#34495e').pack(anchor=tk.W, pady=2)
+        
+        tk.Label(debug_frame, 
+                text="💡 Logs every key press and detection poll in Auto Hunt, PP Hunt and Sweet Scent", 
+                font=('Segoe UI', 7), 
+                fg='#95a5a6', bg='#2a2a2a').pack(anchor=tk.W, padx=20)
+        
         # Pokemon List Management section
         pokemon_frame = tk.Frame(scrollable_frame, bg='#2a2a2a', relief=tk.RAISED, bd=1)
         pokemon_frame.pack(fill=tk.X, pady=(0, 10))
@@ -2097,6 +2129,17 @@ class PokeMMOOverlay:
         # Update again in 1 second
         self.root.after(1000, self.update_status)
     
+    def poll_encounter_popups(self):
+        """Show special encounter popups queued by the hunt threads (Tk is only touched from this thread)"""
+        try:
+            while True:
+                title, message = self.auto_hunt_engine.popup_queue.get_nowait()
+                messagebox.showinfo(title, message, parent=self.root)
+        except queue.Empty:
+            pass
+        
+        self.root.after(250, self.poll_encounter_popups)
+    
     # Auto Hunt Methods
     def start_auto_hunt(self):
         """Start the auto hunt system"""
@@ -3150,6 +3193,23 @@ class PokeMMOOverlay:
             
         except Exception as e:
             print(f"❌ Error updating auto hunt debug config: {e}")
+    
+    def update_debug_metrics_config(self):
+        """Turn the Auto Hunt engine's stage latency metrics on or off"""
+        try:
+            self.auto_hunt_engine.set_debug_metrics(self.debug_metrics_var.get())
+        except Exception as e:
+            print(f"❌ Error updating debug metrics: {e}")
+    
+    def update_verbose_logging_config(self):
+        """Turn per-poll logging on or off for every hunt engine"""
+        try:
+            verbose = self.verbose_logging_var.get()
+            for engine in (self.auto_hunt_engine, self.pp_auto_hunt_engine, self.sweet_scent_engine):
+                engine.verbose = verbose
+            print(f"🔧 Verbose hunt logging: {'Enabled' if verbose else 'Disabled'}")
+        except Exception as e:
+            print(f"❌ Error updating verbose logging: {e}")
 
 class DetectionAreaSelector:
     """Interactive overlay for selecting Pokemon detection area"""
@@ -8,8 +8,8 @@ import os
 import json
 import cv2
 import numpy as np
-from PIL import Image, ImageGrab
 from typing import Dict, Any, Optional, Callable
+from auto_hunt import AutoHuntEngine
 
 
 class SweetScentEngine:
@@ -26,7 +26,6 @@ class SweetScentEngine:
             print("✅ Sweet Scent: Using shared AutoHuntEngine instance (custom detection area and OCR frequency preserved)")
         else:
             # Create AutoHuntEngine instance for Pokemon detection (fallback)
-            from auto_hunt import AutoHuntEngine
             self.auto_hunt_engine = AutoHuntEngine(window_manager, input_manager)
             print("⚠️ Sweet Scent: Created new AutoHuntEngine instance (custom settings may not be shared)")
         
@@ -34,6 +33,7 @@ class SweetScentEngine:
         self.is_hunting = False
         self.is_paused = False
         self.stop_flag = False
+        self._stop_event = threading.Event()  # Set on stop to wake interruptible_sleep
         self.hunt_thread = None
         
         # Sweet Scent configuration
@@ -52,6 +52,7 @@ class SweetScentEngine:
         self.cycle_pause = 1.0  # Pause between cycles
         self.initial_focus_delay = 2.0  # Wait before first Q press to ensure game focus
         self.use_e_plus_e = False  # Use E+E instead of X+E loop
+        self.verbose = False  # Per-key logging inside the Sweet Scent and encounter loops
         
         # Debug configuration
         self.debug_pokecenter_enabled = False  # Enable pokecenter stuck detection
@@ -110,18 +111,14 @@ class SweetScentEngine:
             if not game_pos:
                 return None
             
-            # Capture the game window area
-            screenshot = ImageGrab.grab(bbox=(
-                game_pos['x'], 
-                game_pos['y'], 
-                game_pos['x'] + game_pos['width'], 
+            # Capture the game window area straight into a BGR array (mss when available, else ImageGrab)
+            return self.auto_hunt_engine.capture_game_region((
+                game_pos['x'],
+                game_pos['y'],
+                game_pos['x'] + game_pos['width'],
                 game_pos['y'] + game_pos['height']
             ))
             
-            # Convert PIL image to OpenCV format
-            screenshot_cv = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR)
-            return screenshot_cv
-            
         except Exception as e:
             print(f"❌ Error capturing game screen: {e}")
             return None
@@ -369,22 +366,16 @@ class SweetScentEngine:
             print("✓ No pokecenter dialogue detected")
             return True
     
-    def interruptible_sleep(self, duration: float, check_interval: float = 0.1) -> bool:
-        """Sleep for duration but check stop flag every check_interval seconds
+    def interruptible_sleep(self, duration: float) -> bool:
+        """Sleep for duration, waking as soon as the hunt is stopped
         Returns True if completed normally, False if interrupted by stop flag"""
         if duration <= 0:
             return True
-            
-        elapsed = 0.0
-        while elapsed < duration:
-            if self.stop_flag:
-                return False
-            
-            sleep_time = min(check_interval, duration - elapsed)
-            time.sleep(sleep_time)
-            elapsed += sleep_time
+        if self.stop_flag:
+            return False
         
-        return True
+        self._stop_event.wait(duration)
+        return not self.stop_flag
     
     def set_movement_macro(self, macro_name: str) -> bool:
         """Set the movement macro to use for positioning"""
@@ -403,8 +394,7 @@ class SweetScentEngine:
     
     def macro_exists(self, macro_name: str) -> bool:
         """Check if a macro exists"""
-        available_macros = self.get_available_macros()
-        return macro_name in available_macros
+        return macro_name in self.macro_manager.get_macro_index()
     
     def execute_movement_macro(self):
         """Execute the selected movement macro"""
@@ -422,12 +412,8 @@ class SweetScentEngine:
         # Load and play the macro
         try:
             # Find the macro file path by name
-            macro_list = self.macro_manager.get_macro_list()
-            macro_filepath = None
-            for macro_info in macro_list:
-                if macro_info['name'] == self.selected_macro:
-                    macro_filepath = macro_info['filepath']
-                    break
+            macro_info = self.macro_manager.get_macro_index().get(self.selected_macro)
+            macro_filepath = macro_info['filepath'] if macro_info else None
             
             if not macro_filepath:
                 print(f"❌ Macro '{self.selected_macro}' not found")
@@ -486,7 +472,8 @@ class SweetScentEngine:
     
     def press_key_with_delay(self, key: str, duration: float = 0.1):
         """Press a key for specified duration"""
-        print(f"🎮 Pressing {key.upper()} key")
+        if self.verbose:
+            print(f"🎮 Pressing {key.upper()} key")
         self.input_manager.press_key(key)
         time.sleep(duration)
         self.input_manager.release_key(key)
@@ -527,46 +514,33 @@ class SweetScentEngine:
     def perform_encounter_loop(self):
         """Perform the encounter loop for specified duration (E+E or X+E based on setting)"""
         loop_type = "E+E" if self.use_e_plus_e else "X+E"
+        first_key = 'e' if self.use_e_plus_e else 'x'  # Fixed for the whole loop, resolved once
         print(f"🔄 Starting {loop_type} encounter loop for {self.encounter_loop_duration}s")
         
-        start_time = time.time()
+        loop_deadline = time.monotonic() + self.encounter_loop_duration
         loop_count = 0
         
-        while time.time() - start_time < self.encounter_loop_duration:
+        while time.monotonic() < loop_deadline:
             if self.stop_flag or self.is_paused:
                 break
             
             loop_count += 1
             
-            if self.use_e_plus_e:
-                # E+E loop
-                self.press_key_with_delay('e', 0.1)
-                if not self.interruptible_sleep(self.encounter_loop_interval):
-                    break
-                
-                if self.stop_flag or self.is_paused:
-                    break
-                
-                self.press_key_with_delay('e', 0.1)
-                if not self.interruptible_sleep(self.encounter_loop_interval):
-                    break
-            else:
-                # X+E loop (default)
-                self.press_key_with_delay('x', 0.1)
-                if not self.interruptible_sleep(self.encounter_loop_interval):
-                    break
-                
-                if self.stop_flag or self.is_paused:
-                    break
-                
-                self.press_key_with_delay('e', 0.1)
-                if not self.interruptible_sleep(self.encounter_loop_interval):
-                    break
+            # E+E or X+E (default) - both variants only differ in the first key
+            self.press_key_with_delay(first_key, 0.1)
+            if not self.interruptible_sleep(self.encounter_loop_interval):
+                break
+            
+            if self.stop_flag or self.is_paused:
+                break
+            
+            self.press_key_with_delay('e', 0.1)
+            if not self.interruptible_sleep(self.encounter_loop_interval):
+                break
             
             # Update status occasionally
             if loop_count % 10 == 0:
-                elapsed = time.time() - start_time
-                remaining = self.encounter_loop_duration - elapsed
+                remaining = loop_deadline - time.monotonic()
                 print(f"🔄 {loop_type} loop: {remaining:.1f}s remaining")
         
         if self.stop_flag:
@@ -718,6 +692,7 @@ class SweetScentEngine:
         
         # Reset statistics and flags FIRST
         self.stop_flag = False  # Reset stop flag immediately
+        self._stop_event.clear()
         self.is_hunting = True
         self.is_paused = False
         self.encounters_found = 0
@@ -755,6 +730,7 @@ class SweetScentEngine:
         
         # Reset statistics and flags FIRST
         self.stop_flag = False  # Reset stop flag immediately
+        self._stop_event.clear()
         self.is_hunting = True
         self.is_paused = False
         self.encounters_found = 0
@@ -779,6 +755,7 @@ class SweetScentEngine:
         print("🛑 Stopping Sweet Scent hunt...")
         self.is_hunting = False
         self.stop_flag = True
+        self._stop_event.set()
         
         # Wait for thread to finish
         if self.hunt_thread and threading.current_thread() != self.hunt_thread:
@@ -788,6 +765,7 @@ class SweetScentEngine:
         self.is_hunting = False
         self.is_paused = False
         self.stop_flag = False
+        self._stop_event.clear()
         self.hunt_thread = None
         
         # Reset input manager stop flag as well
@@ -804,6 +782,7 @@ class SweetScentEngine:
         self.is_hunting = False
         self.is_paused = False
         self.stop_flag = False
+        self._stop_event.clear()
         
         # Reset thread
         self.hunt_thread = None